@@ -560,11 +560,13 @@ def demo_ttx_operations(files: List[str], args: argparse.Namespace):
 
     capabilities = [
         "Load TTX files with lxml or fallback to ElementTree",
+        "Stream only the name table from TTX for read-only lookups",
         "Find name table elements in TTX structure",
         "Locate specific namerecords by ID and platform",
         "Update namerecord values with minimal diff",
         "Create new namerecords when missing",
         "Deduplicate duplicate namerecords",
+        "Remap fvar/STAT nameID references in a single bulk pass",
         "Write TTX files preserving structure/whitespace",
     ]
 
@@ -593,6 +595,7 @@ def demo_ttx_operations(files: List[str], args: argparse.Namespace):
         "Open font files with fontTools",
         "Update namerecords in binary fonts",
         "Deduplicate namerecords in binary fonts",
+        "Remap fvar/STAT nameID references in binary fonts in one pass",
         "Preserve all other font data unchanged",
     ]
 
@@ -26,7 +26,8 @@ Usage:
 """
 
 from __future__ import annotations
-from typing import Iterator, Optional, Any
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional
 from dataclasses import dataclass
 from FontCore.core_logging_config import get_logger
 
@@ -38,8 +39,36 @@ EID_UNICODE_BMP = 1
 LANG_EN_US_HEX = "0x409"
 LANG_EN_US_INT = 0x0409
 
+# Hex strings for language IDs seen so far (ja, ko, zh-CN, ... across a batch)
+_HEX_CACHE: dict[int, str] = {
+    0x0411: "0x411",
+    0x0412: "0x412",
+    0x0804: "0x804",
+}
+_HEX_CACHE_MAX = 64
 
-@dataclass(frozen=True)
+
+def _normalize_lang_id(lang_id: int | str) -> tuple[str, int]:
+    """Normalize a language ID to its (TTX hex string, binary int) forms."""
+    if isinstance(lang_id, str):
+        try:
+            lang_id_int = int(lang_id, 16) if lang_id.startswith("0x") else int(lang_id)
+        except ValueError:
+            logger.warning("Invalid lang_id string '%s', using 0x409", lang_id)
+            return LANG_EN_US_HEX, LANG_EN_US_INT
+        return lang_id, lang_id_int
+    lang_id_int = int(lang_id)
+    if lang_id_int == LANG_EN_US_INT:
+        return LANG_EN_US_HEX, lang_id_int
+    lang_id_hex = _HEX_CACHE.get(lang_id_int)
+    if lang_id_hex is None:
+        lang_id_hex = f"0x{lang_id_int:x}"
+        if len(_HEX_CACHE) < _HEX_CACHE_MAX:
+            _HEX_CACHE[lang_id_int] = lang_id_hex
+    return lang_id_hex, lang_id_int
+
+
+@dataclass(frozen=True, slots=True)
 class NameRecordCriteria:
     """
     Immutable criteria for matching name records.
@@ -82,20 +111,7 @@ class NameRecordCriteria:
             >>> c.lang_id_int
             1033
         """
-        # Normalize lang_id to both formats
-        if isinstance(lang_id, str):
-            lang_id_hex = lang_id
-            try:
-                lang_id_int = (
-                    int(lang_id, 16) if lang_id.startswith("0x") else int(lang_id)
-                )
-            except ValueError:
-                logger.warning(f"Invalid lang_id string '{lang_id}', using 0x409")
-                lang_id_int = LANG_EN_US_INT
-                lang_id_hex = LANG_EN_US_HEX
-        else:
-            lang_id_int = int(lang_id)
-            lang_id_hex = f"0x{lang_id_int:x}"
+        lang_id_hex, lang_id_int = _normalize_lang_id(lang_id)
 
         return cls(
             name_id=int(name_id),
@@ -114,6 +130,39 @@ class NameRecordCriteria:
         )
 
 
+def _compile_ttx_predicate(
+    name_id: str, platform_id: str, plat_enc_id: str, lang_id: str
+) -> Callable[[Any], bool]:
+    """Build a TTX element predicate with the criteria bound as closure cells."""
+
+    def _matches(element: Any) -> bool:
+        get = element.get
+        return (
+            get("nameID") == name_id
+            and get("platformID") == platform_id
+            and get("platEncID") == plat_enc_id
+            and get("langID") == lang_id
+        )
+
+    return _matches
+
+
+def _compile_binary_predicate(
+    name_id: int, platform_id: int, plat_enc_id: int, lang_id: int
+) -> Callable[[Any], bool]:
+    """Build a binary NameRecord predicate with the criteria bound as closure cells."""
+
+    def _matches(record: Any) -> bool:
+        return (
+            record.nameID == name_id
+            and record.platformID == platform_id
+            and record.platEncID == plat_enc_id
+            and record.langID == lang_id
+        )
+
+    return _matches
+
+
 class NameRecordMatcher:
     """
     Unified interface for matching name records in TTX and binary fonts.
@@ -130,6 +179,46 @@ class NameRecordMatcher:
             criteria: Matching criteria
         """
         self.criteria = criteria
+        # Flattened comparison values so the match methods skip the
+        # self.criteria indirection on every record
+        self._name_id = criteria.name_id
+        self._pid = criteria.platform_id
+        self._eid = criteria.plat_enc_id
+        self._lang_int = criteria.lang_id_int
+        self._name_id_str = str(criteria.name_id)
+        self._pid_str = str(criteria.platform_id)
+        self._eid_str = str(criteria.plat_enc_id)
+        self._lang_hex = criteria.lang_id_hex
+        # ElementPath predicate for the common all-attribute-equality lookup
+        self._ttx_xpath = (
+            f'namerecord[@nameID="{self._name_id_str}"]'
+            f'[@platformID="{self._pid_str}"]'
+            f'[@platEncID="{self._eid_str}"]'
+            f'[@langID="{self._lang_hex}"]'
+        )
+        # Key into the index produced by build_ttx_index()
+        self._ttx_target = (
+            self._name_id_str,
+            self._pid_str,
+            self._eid_str,
+            self._lang_hex,
+        )
+        # Unguarded predicates specialized to this matcher's constants
+        self._matches_ttx_fast = _compile_ttx_predicate(*self._ttx_target)
+        self._matches_binary_fast = _compile_binary_predicate(
+            self._name_id, self._pid, self._eid, self._lang_int
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NameRecordMatcher):
+            return NotImplemented
+        return self.criteria == other.criteria
+
+    def __hash__(self) -> int:
+        return hash(self.criteria)
+
+    def __repr__(self) -> str:
+        return f"NameRecordMatcher({self.criteria})"
 
     @classmethod
     def for_ttx(
@@ -156,8 +245,15 @@ class NameRecordMatcher:
             >>> matcher.criteria.name_id
             1
         """
-        criteria = NameRecordCriteria.create(name_id, platform_id, plat_enc_id, lang_id)
-        return cls(criteria)
+        if cls is not NameRecordMatcher:
+            criteria = NameRecordCriteria.create(
+                name_id, platform_id, plat_enc_id, lang_id
+            )
+            return cls(criteria)
+        lang_id_hex, lang_id_int = _normalize_lang_id(lang_id)
+        return _make_matcher(
+            int(name_id), int(platform_id), int(plat_enc_id), lang_id_hex, lang_id_int
+        )
 
     @classmethod
     def for_binary(
@@ -184,8 +280,15 @@ class NameRecordMatcher:
             >>> matcher.criteria.lang_id_int
             1033
         """
-        criteria = NameRecordCriteria.create(name_id, platform_id, plat_enc_id, lang_id)
-        return cls(criteria)
+        if cls is not NameRecordMatcher:
+            criteria = NameRecordCriteria.create(
+                name_id, platform_id, plat_enc_id, lang_id
+            )
+            return cls(criteria)
+        lang_id_hex, lang_id_int = _normalize_lang_id(lang_id)
+        return _make_matcher(
+            int(name_id), int(platform_id), int(plat_enc_id), lang_id_hex, lang_id_int
+        )
 
     def matches_ttx(self, element: Any) -> bool:
         """
@@ -204,14 +307,9 @@ class NameRecordMatcher:
             True
         """
         try:
-            return (
-                element.get("nameID") == str(self.criteria.name_id)
-                and element.get("platformID") == str(self.criteria.platform_id)
-                and element.get("platEncID") == str(self.criteria.plat_enc_id)
-                and element.get("langID") == self.criteria.lang_id_hex
-            )
+            return self._matches_ttx_fast(element)
         except AttributeError as e:
-            logger.debug(f"Invalid element for TTX matching: {e}")
+            logger.debug("Invalid element for TTX matching: %s", e)
             return False
 
     def matches_binary(self, record: Any) -> bool:
@@ -231,14 +329,9 @@ class NameRecordMatcher:
             True
         """
         try:
-            return (
-                getattr(record, "nameID", None) == self.criteria.name_id
-                and getattr(record, "platformID", None) == self.criteria.platform_id
-                and getattr(record, "platEncID", None) == self.criteria.plat_enc_id
-                and getattr(record, "langID", None) == self.criteria.lang_id_int
-            )
+            return self._matches_binary_fast(record)
         except Exception as e:
-            logger.debug(f"Invalid record for binary matching: {e}")
+            logger.debug("Invalid record for binary matching: %s", e)
             return False
 
     def iter_matches_ttx(self, name_table: Any) -> Iterator[Any]:
@@ -256,8 +349,10 @@ class NameRecordMatcher:
             >>> for nr in matcher.iter_matches_ttx(name_table):
             ...     print(nr.text)
         """
+        # findall("namerecord") only yields elements, so skip the guarded path
+        matches = self._matches_ttx_fast
         for element in name_table.findall("namerecord"):
-            if self.matches_ttx(element):
+            if matches(element):
                 yield element
 
     def iter_matches_binary(self, name_table: Any) -> Iterator[Any]:
@@ -275,8 +370,9 @@ class NameRecordMatcher:
             >>> for record in matcher.iter_matches_binary(font["name"]):
             ...     print(record.toUnicode())
         """
+        matches = self.matches_binary
         for record in name_table.names:
-            if self.matches_binary(record):
+            if matches(record):
                 yield record
 
     def find_first_ttx(self, name_table: Any) -> Optional[Any]:
@@ -295,9 +391,57 @@ class NameRecordMatcher:
             >>> if nr:
             ...     print(nr.text)
         """
-        for element in self.iter_matches_ttx(name_table):
-            return element
-        return None
+        try:
+            return name_table.find(self._ttx_xpath)
+        except SyntaxError:
+            # Path engine rejected an attribute value; fall back to a Python scan
+            for element in self.iter_matches_ttx(name_table):
+                return element
+            return None
+
+    @staticmethod
+    def build_ttx_index(name_table: Any) -> dict[tuple, list[Any]]:
+        """
+        Index TTX namerecord elements by their matching attributes.
+
+        Scans the direct namerecord children once (the same records
+        find_first_ttx sees) so that many matchers can each resolve with a
+        single dict lookup instead of walking every record.
+
+        Args:
+            name_table: TTX name table element
+
+        Returns:
+            Dict mapping (nameID, platformID, platEncID, langID) attribute
+            strings to matching elements in document order
+
+        Examples:
+            >>> index = NameRecordMatcher.build_ttx_index(name_table)
+            >>> for nid in (1, 2, 4, 6):
+            ...     nr = NameRecordMatcher.for_ttx(nid).find_first_ttx_indexed(index)
+        """
+        index: dict[tuple, list[Any]] = {}
+        for element in name_table.iterfind("namerecord"):
+            get = element.get
+            key = (get("nameID"), get("platformID"), get("platEncID"), get("langID"))
+            bucket = index.get(key)
+            if bucket is None:
+                index[key] = [element]
+            else:
+                bucket.append(element)
+        return index
+
+    def find_first_ttx_indexed(self, index: dict[tuple, list[Any]]) -> Optional[Any]:
+        """
+        Find first matching TTX namerecord using a prebuilt index.
+
+        Args:
+            index: Index returned by build_ttx_index()
+
+        Returns:
+            First matching element or None
+        """
+        return index.get(self._ttx_target, (None,))[0]
 
     def find_first_binary(self, name_table: Any) -> Optional[Any]:
         """
@@ -344,6 +488,27 @@ class NameRecordMatcher:
         return sum(1 for _ in self.iter_matches_binary(name_table))
 
 
+@lru_cache(maxsize=128)
+def _make_matcher(
+    name_id: int, platform_id: int, plat_enc_id: int, lang_id_hex: str, lang_id_int: int
+) -> NameRecordMatcher:
+    """
+    Return a shared matcher for the given normalized criteria.
+
+    Matchers hold only immutable criteria, so one instance can safely serve
+    every caller asking for the same (nameID, platformID, platEncID, langID).
+    """
+    return NameRecordMatcher(
+        NameRecordCriteria(
+            name_id=name_id,
+            platform_id=platform_id,
+            plat_enc_id=plat_enc_id,
+            lang_id_hex=lang_id_hex,
+            lang_id_int=lang_id_int,
+        )
+    )
+
+
 # Convenience functions for backward compatibility
 def find_namerecord_ttx(
     name_table: Any,
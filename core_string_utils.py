@@ -49,7 +49,7 @@ def is_empty(value: Optional[str]) -> bool:
         >>> is_empty("  content  ")
         False
     """
-    return not value or not str(value).strip()
+    return value is None or not value or not value.strip()
 
 
 def normalize_empty(value: Optional[str]) -> Optional[str]:
@@ -76,7 +76,7 @@ def normalize_empty(value: Optional[str]) -> Optional[str]:
     """
     if value is None:
         return None
-    stripped = str(value).strip()
+    stripped = value.strip()
     return stripped if stripped else None
 
 
@@ -101,8 +101,9 @@ def normalize_empty_to_default(value: Optional[str], default: str = "") -> str:
         >>> normalize_empty_to_default("  content  ", "Unknown")
         'content'
     """
-    normalized = normalize_empty(value)
-    return normalized if normalized is not None else default
+    if value is None:
+        return default
+    return value.strip() or default
 
 
 def safe_strip(value: Optional[str]) -> str:
@@ -123,7 +124,7 @@ def safe_strip(value: Optional[str]) -> str:
         >>> safe_strip("  content  ")
         'content'
     """
-    return str(value).strip() if value is not None else ""
+    return value.strip() if value else ""
 
 
 def coalesce(*values: Optional[str]) -> Optional[str]:
@@ -147,8 +148,11 @@ def coalesce(*values: Optional[str]) -> Optional[str]:
         None
     """
     for value in values:
-        if not is_empty(value):
-            return normalize_empty(value)
+        if value is None:
+            continue
+        stripped = value.strip()
+        if stripped:
+            return stripped
     return None
 
 
@@ -195,8 +199,11 @@ def join_nonempty(*parts: Optional[str], separator: str = " ") -> str:
         >>> join_nonempty(None, "", separator="-")
         ''
     """
-    cleaned = [normalize_empty(p) for p in parts]
-    return separator.join(p for p in cleaned if p is not None)
+    # Fast path: programmatically built names are usually already clean
+    if all(parts) and all(p == p.strip() for p in parts):
+        return separator.join(parts)  # type: ignore[arg-type]
+    stripped = (p.strip() for p in parts if p)
+    return separator.join(s for s in stripped if s)
 
 
 def apply_if_present(
@@ -223,6 +230,9 @@ def apply_if_present(
         >>> apply_if_present("", lambda x: x.split(), default=[])
         []
     """
-    if is_empty(value):
+    if value is None:
+        return default
+    stripped = value.strip()
+    if not stripped:
         return default
-    return func(normalize_empty(value))  # type: ignore
+    return func(stripped)
@@ -17,7 +17,10 @@ Maintenance Note:
 
 from __future__ import annotations
 
-import re
+import operator
+import weakref
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, Tuple
 
 try:
@@ -57,6 +60,19 @@ XPATH_STAT = ".//STAT"
 XPATH_ELIDED_FALLBACK = ".//ElidedFallbackNameID"
 XPATH_AXIS_VALUE = ".//AxisValue"
 XPATH_DESIGN_AXIS = ".//DesignAxisRecord//Axis"
+XPATH_NAMED_INSTANCE = ".//NamedInstance"
+
+
+def _find_table_ttx(root, tag: str):
+    """Find a TTX table, checking the root's direct children before descendants.
+
+    Tables are direct children of <ttFont>, so the descendant search only runs
+    for wrapped TTX variants or tables that are absent.
+    """
+    el = root.find(tag)
+    if el is None:
+        el = root.find(".//" + tag)
+    return el
 
 
 def load_ttx(path: str):
@@ -67,14 +83,60 @@ def load_ttx(path: str):
             tree = LET.parse(path, parser)
             root = tree.getroot()
             return tree, root, True
-        tree = ET_fallback.parse(path)
-        root = tree.getroot()
+        # Read once and feed the C-accelerated parser in a single call
+        parser = ET_fallback.XMLParser(target=ET_fallback.TreeBuilder())
+        with open(path, "rb") as f:
+            parser.feed(f.read())
+        root = parser.close()
+        tree = ET_fallback.ElementTree(root)
         return tree, root, False
     except Exception as e:
         logger.error(f"Failed to load TTX file '{path}': {e}")
         raise  # Re-raise after logging
 
 
+def load_ttx_name_only(path: str):
+    """Stream a TTX file and return only its <name> table, for read-only use.
+
+    Top-level tables that close before <name> are cleared as they stream past
+    and parsing stops at </name>, so glyph data is never held in memory.
+    Returns (tree, name_element, using_lxml). With either parser the tree is
+    rooted at <ttFont> and holds only the tables up to and including <name>
+    (earlier ones emptied); tree and name_element are None when the file has
+    no name table. Use load_ttx for anything that will be written.
+    """
+    try:
+        if _LXML_AVAILABLE:
+            context = LET.iterparse(
+                path,
+                events=("start", "end"),
+                remove_blank_text=False,
+                remove_comments=False,
+            )
+        else:
+            context = ET_fallback.iterparse(path, events=("start", "end"))
+        depth = 0
+        root = None
+        for event, el in context:
+            if event == "start":
+                if root is None:
+                    root = el
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if el.tag == "name":
+                if _LXML_AVAILABLE:
+                    return root.getroottree(), el, True
+                return ET_fallback.ElementTree(root), el, False
+            el.clear()
+        return None, None, _LXML_AVAILABLE
+    except Exception as e:
+        logger.error(f"Failed to stream TTX file '{path}': {e}")
+        raise
+
+
 def write_ttx(tree, path: str, using_lxml: bool) -> None:
     """Write a TTX tree without pretty-printing to minimize diffs."""
     if using_lxml:
@@ -84,13 +146,22 @@ def write_ttx(tree, path: str, using_lxml: bool) -> None:
 
 
 def find_name_table(root):
-    return root.find(XPATH_NAME)
+    return _find_table_ttx(root, "name")
+
+
+def _iter_namerecords(name_table):
+    """Iterate the direct <namerecord> children of a name table without building a list."""
+    if _LXML_AVAILABLE and isinstance(name_table, LET._Element):
+        return name_table.iterchildren("namerecord")
+    return name_table.iterfind("namerecord")
 
 
 def _iter_matching_namerecords(name_table, name_id: int, pid: int, eid: int, lang: str):
     """Legacy function - now uses NameRecordMatcher."""
-    matcher = NameRecordMatcher.for_ttx(name_id, pid, eid, lang)
-    yield from matcher.iter_matches_ttx(name_table)
+    matches = NameRecordMatcher.for_ttx(name_id, pid, eid, lang).matches_ttx
+    for nr in _iter_namerecords(name_table):
+        if matches(nr):
+            yield nr
 
 
 def find_namerecord_ttx(
@@ -109,14 +180,13 @@ def _extract_wrapped_text(text: Optional[str]) -> Tuple[str, str, str]:
     """Split an element.text into (prefix_ws, core, suffix_ws)."""
     if not text:
         return "", "", ""
-    core = text.strip()
-    if not core:
+    lstripped = text.lstrip()
+    if not lstripped:
         return text, "", ""
-    start = text.find(core)
-    end = start + len(core)
-    prefix = text[:start]
-    suffix = text[end:]
-    return prefix, core, suffix
+    prefix_len = len(text) - len(lstripped)
+    core = lstripped.rstrip()
+    suffix_start = prefix_len + len(core)
+    return text[:prefix_len], core, text[suffix_start:]
 
 
 def _default_wrappers(name_table) -> Tuple[str, str]:
@@ -130,30 +200,47 @@ def _default_wrappers(name_table) -> Tuple[str, str]:
 
 
 def _is_ws(s: Optional[str]) -> bool:
-    return s is not None and re.fullmatch(r"\s*", s or "") is not None
+    return s is not None and (not s or s.isspace())
 
 
-def _insert_in_order(name_table, new_record) -> None:
-    """Insert new_record into name_table maintaining ascending nameID order."""
+def _parse_nameid(value: Optional[str]) -> Optional[int]:
+    """Parse a nameID attribute string, returning None when missing or malformed."""
+    if not value:
+        return None
+    # isdigit() also accepts characters like "²" that int() rejects
+    if value.isascii() and value.isdecimal():
+        return int(value)
     try:
-        target_id = int(new_record.get("nameID"))
-    except Exception:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _insert_in_order(name_table, new_record) -> int:
+    """Insert new_record into name_table maintaining ascending nameID order.
+
+    Returns the new record's position among the table's namerecords.
+    """
+    target_id = _parse_nameid(new_record.get("nameID"))
+    if target_id is None:
         target_id = 999999
     insert_at = len(name_table)
     idx = 0
+    nr_idx = 0
     for child in name_table:
         if child.tag != "namerecord":
             idx += 1
             continue
-        try:
-            child_id = int(child.get("nameID", "999999"))
-        except Exception:
+        child_id = _parse_nameid(child.get("nameID"))
+        if child_id is None:
             child_id = 999999
         if child_id > target_id:
             insert_at = idx
             break
         idx += 1
+        nr_idx += 1
     name_table.insert(insert_at, new_record)
+    return nr_idx
 
 
 def update_namerecord_ttx(
@@ -252,15 +339,61 @@ def open_font(path: str) -> TTFont:
     return TTFont(path)
 
 
+class _FontView:
+    """Lazily resolved table handles for one binary font.
+
+    TTFont.__getitem__ goes through the table cache (and may decompile) on
+    every call; a view resolves each table once so multi-step pipelines can
+    share it. Missing tables resolve to None.
+    """
+
+    def __init__(self, font: TTFont):
+        self.font = font
+
+    @cached_property
+    def name_table(self):
+        return self.font.get("name")
+
+    @cached_property
+    def fvar(self):
+        return self.font.get("fvar")
+
+    @cached_property
+    def stat_table(self):
+        stat = self.font.get("STAT")
+        return stat.table if stat is not None else None
+
+    @cached_property
+    def os2(self):
+        return self.font.get("OS/2")
+
+    @cached_property
+    def head(self):
+        return self.font.get("head")
+
+    @cached_property
+    def post(self):
+        return self.font.get("post")
+
+
+def _font_view(font) -> _FontView:
+    """Return `font` if it is already a _FontView, otherwise wrap it."""
+    return font if isinstance(font, _FontView) else _FontView(font)
+
+
+_NAMERECORD_KEY = operator.attrgetter("nameID", "platformID", "platEncID", "langID")
+
+
 def _iter_matching_binary(name_table, name_id: int, pid: int, eid: int, lang: int):
+    target = (name_id, pid, eid, lang)
+    key = _NAMERECORD_KEY
     for record in name_table.names:
-        if (
-            getattr(record, "nameID", None) == name_id
-            and getattr(record, "platformID", None) == pid
-            and getattr(record, "platEncID", None) == eid
-            and getattr(record, "langID", None) == lang
-        ):
-            yield record
+        try:
+            if key(record) == target:
+                yield record
+        except AttributeError:
+            # Incomplete record (e.g. freshly constructed); cannot match
+            continue
 
 
 def update_namerecord_binary(
@@ -272,10 +405,10 @@ def update_namerecord_binary(
     lang: int = LANG_EN_US_INT,
 ) -> Tuple[bool, Optional[str]]:
     """Update Windows/English namerecord in a binary font."""
-    if "name" not in font:
+    table = _font_view(font).name_table
+    if table is None:
         logger.debug(f"Font has no 'name' table, cannot update nameID {name_id}")
         return False, None
-    table = font["name"]
     target = None
     for rec in _iter_matching_binary(table, name_id, pid, eid, lang):
         target = rec
@@ -287,15 +420,16 @@ def update_namerecord_binary(
         )
         return False, None
     try:
-        old_text = (
-            target.toUnicode() if hasattr(target, "toUnicode") else str(target.string)
-        )
+        old_text = target.toUnicode()
+    except AttributeError:
+        old_text = str(getattr(target, "string", ""))
     except Exception as e:
         logger.warning(f"Failed to decode namerecord {name_id}: {e}")
         old_text = str(getattr(target, "string", ""))
     if old_text == new_value:
         return False, old_text
     target.string = new_value
+    invalidate_style_name_cache(font)
     return True, old_text
 
 
@@ -307,31 +441,19 @@ def deduplicate_namerecords_binary(
     lang: int = LANG_EN_US_INT,
 ) -> int:
     """Remove duplicate Windows/English namerecords for a given nameID in a binary font table."""
-    matches = [
-        r
-        for r in name_table.names
-        if (
-            getattr(r, "nameID", None) == name_id
-            and getattr(r, "platformID", None) == pid
-            and getattr(r, "platEncID", None) == eid
-            and getattr(r, "langID", None) == lang
-        )
-    ]
+    matches = list(_iter_matching_binary(name_table, name_id, pid, eid, lang))
     if len(matches) <= 1:
         return 0
 
-    new_names = []
-    kept_one = False
-    removed = 0
-    for rec in name_table.names:
-        if rec in matches:
-            if not kept_one:
-                new_names.append(rec)
-                kept_one = True
-            else:
-                removed += 1
-        else:
-            new_names.append(rec)
+    # Keep everything up to and including the first match; after it, drop
+    # every record that is (by identity) one of the matches.
+    names = name_table.names
+    first = matches[0]
+    first_idx = next(i for i, r in enumerate(names) if r is first)
+    match_ids = {id(r) for r in matches}
+    new_names = names[: first_idx + 1]
+    new_names.extend(r for r in names[first_idx + 1 :] if id(r) not in match_ids)
+    removed = len(names) - len(new_names)
     name_table.names = new_names
     return removed
 
@@ -342,6 +464,7 @@ __all__ = [
     "LANG_EN_US_HEX",
     "LANG_EN_US_INT",
     "load_ttx",
+    "load_ttx_name_only",
     "write_ttx",
     "find_name_table",
     "find_namerecord_ttx",
@@ -359,6 +482,7 @@ __all__ = [
     "allocate_private_name_id_ttx",
     "create_private_namerecord_ttx",
     "remap_fvar_stat_nameids_ttx",
+    "remap_fvar_stat_nameids_ttx_bulk",
     "preserve_low_nameids_in_fvar_stat_ttx",
     "get_stat_elided_fallback_name_ttx",
     "get_stat_elided_fallback_name_binary",
@@ -368,8 +492,10 @@ __all__ = [
     "allocate_private_name_id_binary",
     "create_private_namerecord_binary",
     "remap_fvar_stat_nameids_binary",
+    "remap_fvar_stat_nameids_binary_bulk",
     "preserve_low_nameids_in_fvar_stat_binary",
     "compute_stat_default_style_name_binary",
+    "invalidate_style_name_cache",
 ]
 
 
@@ -451,20 +577,20 @@ def update_xpath_text(root, xpath: str, new_text: str):
 
 
 def count_mac_name_records_ttx(root) -> int:
-    name_table = root.find(XPATH_NAME)
+    name_table = _find_table_ttx(root, "name")
     if name_table is None:
         return 0
     count = 0
-    for nr in name_table.findall("namerecord"):
+    for nr in _iter_namerecords(name_table):
         if nr.get("platformID") == "1" and nr.get("platEncID") in ("0", "1"):
             count += 1
     return count
 
 
 def count_mac_name_records_binary(font: TTFont) -> int:
-    if "name" not in font:
+    table = _font_view(font).name_table
+    if table is None:
         return 0
-    table = font["name"]
     count = 0
     for record in table.names:
         if getattr(record, "platformID", None) == 1 and getattr(
@@ -477,12 +603,44 @@ def count_mac_name_records_binary(font: TTFont) -> int:
     return count
 
 
-def _get_italic_angle_ttx(root) -> float:
+def _find_tables_ttx(root, tags: tuple[str, ...]) -> dict:
+    """Locate several TTX tables with one pass over the root's children.
+
+    Tables are direct children of <ttFont>; any not found there fall back to a
+    single descendant walk so wrapped TTX variants still resolve.
+    """
+    found: dict = {}
+    wanted = len(tags)
+    for child in root:
+        tag = child.tag
+        if tag in tags and tag not in found:
+            found[tag] = child
+            if len(found) == wanted:
+                return found
+    for el in root.iter():
+        if el is root:
+            continue
+        tag = el.tag
+        if tag in tags and tag not in found:
+            found[tag] = el
+            if len(found) == wanted:
+                break
+    return found
+
+
+def _find_field_ttx(table, tag: str):
+    """Find a table field element, checking direct children before descendants."""
+    el = table.find(tag)
+    if el is None:
+        el = table.find(".//" + tag)
+    return el
+
+
+def _get_italic_angle_ttx(post_table) -> float:
     """Extract italicAngle from post table."""
-    post_table = root.find(".//post")
     if post_table is None:
         return 0.0
-    italic_angle = post_table.find(".//italicAngle")
+    italic_angle = _find_field_ttx(post_table, "italicAngle")
     if italic_angle is not None and italic_angle.get("value"):
         try:
             return float(italic_angle.get("value"))
@@ -495,12 +653,11 @@ def _get_italic_angle_ttx(root) -> float:
     return 0.0
 
 
-def _get_fs_selection_ttx(root) -> int:
+def _get_fs_selection_ttx(os2_table) -> int:
     """Extract fsSelection from OS/2 table."""
-    os2_table = root.find(".//OS_2")
     if os2_table is None:
         return 0
-    fs_selection = os2_table.find(".//fsSelection")
+    fs_selection = _find_field_ttx(os2_table, "fsSelection")
     if fs_selection is not None and fs_selection.get("value"):
         raw = fs_selection.get("value")
         try:
@@ -513,12 +670,11 @@ def _get_fs_selection_ttx(root) -> int:
     return 0
 
 
-def _get_mac_style_ttx(root) -> int:
+def _get_mac_style_ttx(head_table) -> int:
     """Extract macStyle from head table."""
-    head_table = root.find(".//head")
     if head_table is None:
         return 0
-    mac_style = head_table.find(".//macStyle")
+    mac_style = _find_field_ttx(head_table, "macStyle")
     if mac_style is not None and mac_style.get("value"):
         try:
             return int(mac_style.get("value"), 0)
@@ -529,9 +685,10 @@ def _get_mac_style_ttx(root) -> int:
 
 def is_italic_ttx(root) -> bool:
     """Check if font is italic based on post/OS2/head tables."""
-    italic_angle = _get_italic_angle_ttx(root)
-    fs_selection = _get_fs_selection_ttx(root)
-    mac_style = _get_mac_style_ttx(root)
+    tables = _find_tables_ttx(root, ("post", "OS_2", "head"))
+    italic_angle = _get_italic_angle_ttx(tables.get("post"))
+    fs_selection = _get_fs_selection_ttx(tables.get("OS_2"))
+    mac_style = _get_mac_style_ttx(tables.get("head"))
 
     return bool(
         (fs_selection & 0x01)
@@ -543,20 +700,18 @@ def is_italic_ttx(root) -> bool:
 
 def is_italic_binary(font: TTFont) -> bool:
     """Check if font is italic (binary)."""
-    os2_table = font.get("OS/2")
-    head_table = font.get("head")
-    post_table = font.get("post")
-
-    fs_selection = getattr(os2_table, "fsSelection", 0) if os2_table else 0
-    mac_style = getattr(head_table, "macStyle", 0) if head_table else 0
+    view = _font_view(font)
+    # Style bits answer most fonts; only decompile post when both are clear.
+    os2_table = view.os2
+    if os2_table and getattr(os2_table, "fsSelection", 0) & 0x01:
+        return True
+    head_table = view.head
+    if head_table and getattr(head_table, "macStyle", 0) & 0x02:
+        return True
+
+    post_table = view.post
     italic_angle = getattr(post_table, "italicAngle", 0.0) if post_table else 0.0
-
-    return bool(
-        (fs_selection & 0x01)
-        or (mac_style & 0x02)
-        or (italic_angle <= -2)
-        or (italic_angle >= 2)
-    )
+    return bool((italic_angle <= -2) or (italic_angle >= 2))
 
 
 # ---------------- NameID remapping helpers (TTX) ----------------
@@ -578,9 +733,34 @@ def find_name_string_ttx(
     return normalize_empty(core)
 
 
+def _build_nameid_index(
+    name_table,
+    pid: int = PID_WIN,
+    eid: int = EID_UNICODE_BMP,
+    lang: str = LANG_EN_US_HEX,
+) -> dict[int, object]:
+    """Map nameID -> first namerecord for the given platform/encoding/language."""
+    pid_s, eid_s = str(pid), str(eid)
+    index: dict[int, object] = {}
+    for nr in _iter_namerecords(name_table):
+        if (
+            nr.get("platformID") != pid_s
+            or nr.get("platEncID") != eid_s
+            or nr.get("langID") != lang
+        ):
+            continue
+        try:
+            nid = int(nr.get("nameID", ""))
+        except (TypeError, ValueError):
+            continue
+        if nid not in index:
+            index[nid] = nr
+    return index
+
+
 def find_name_string_any_platform_ttx(name_table, name_id: int) -> str | None:
     """Return the first namerecord.text core for a given nameID across any platform/encoding."""
-    for nr in name_table.findall("namerecord"):
+    for nr in _iter_namerecords(name_table):
         try:
             if int(nr.get("nameID", "")) != int(name_id):
                 continue
@@ -595,14 +775,40 @@ def find_name_string_any_platform_ttx(name_table, name_id: int) -> str | None:
 def _collect_used_name_ids_ttx(name_table) -> set[int]:
     """Collect all used nameIDs in the name table."""
     used: set[int] = set()
-    for nr in name_table.findall("namerecord"):
+    add = used.add
+    _int = int
+    for nr in _iter_namerecords(name_table):
         try:
-            used.add(int(nr.get("nameID", "")))
-        except Exception:
+            add(_int(nr.get("nameID", "")))
+        except (TypeError, ValueError):
             continue
     return used
 
 
+def _allocate_private_name_id_from(used: set[int], start: int = 256) -> int:
+    """Allocate the lowest free nameID >= start and record it in `used`."""
+    nid = start
+    while nid in used:
+        nid += 1
+    used.add(nid)
+    return nid
+
+
+def _build_name_strings_ttx(
+    name_table,
+    pid: int = PID_WIN,
+    eid: int = EID_UNICODE_BMP,
+    lang: str = LANG_EN_US_HEX,
+) -> dict[int, str]:
+    """Map nameID -> stripped, non-empty string (same values as find_name_string_ttx)."""
+    strings: dict[int, str] = {}
+    for nid, nr in _build_nameid_index(name_table, pid, eid, lang).items():
+        core = normalize_empty(_extract_wrapped_text(nr.text)[1])
+        if core is not None:
+            strings[nid] = core
+    return strings
+
+
 def allocate_private_name_id_ttx(name_table, start: int = 256) -> int:
     """Allocate a new private nameID not currently in use."""
     used = _collect_used_name_ids_ttx(name_table)
@@ -612,30 +818,28 @@ def allocate_private_name_id_ttx(name_table, start: int = 256) -> int:
     return nid
 
 
-def _fix_namerecord_tails(name_table, new_record, siblings_before: list) -> None:
-    """Fix tail formatting for inserted namerecord."""
+def _fix_namerecord_tails(
+    new_record, insert_idx: int, first_sibling, last_sibling, sibling_count: int
+) -> None:
+    """Fix tail formatting for a namerecord inserted at `insert_idx`.
+
+    `first_sibling`, `last_sibling` and `sibling_count` describe the table's
+    namerecords before the insert (both siblings are None when it had none).
+    """
     indent_non_last = "\n    "
     indent_last = "\n  "
 
-    if siblings_before:
-        t0 = siblings_before[0].tail
+    if sibling_count:
+        t0 = first_sibling.tail
         if _is_ws(t0):
             indent_non_last = t0  # type: ignore
-        tl = siblings_before[-1].tail
+        tl = last_sibling.tail
         if _is_ws(tl):
             indent_last = tl  # type: ignore
 
-    children_after = [c for c in name_table if c.tag == "namerecord"]
-    try:
-        new_index = children_after.index(new_record)
-    except ValueError:
-        new_index = len(children_after) - 1
-
-    if new_index == len(children_after) - 1:
-        if len(children_after) >= 2:
-            prev_last = children_after[-2]
-            if _is_ws(prev_last.tail):
-                prev_last.tail = indent_non_last  # type: ignore
+    if insert_idx >= sibling_count:
+        if sibling_count and _is_ws(last_sibling.tail):
+            last_sibling.tail = indent_non_last  # type: ignore
         new_record.tail = indent_last
     else:
         new_record.tail = indent_non_last
@@ -647,101 +851,97 @@ def create_private_namerecord_ttx(
     pid: int = PID_WIN,
     eid: int = EID_UNICODE_BMP,
     lang: str = LANG_EN_US_HEX,
+    used: set[int] | None = None,
 ) -> int:
-    """Create a new private namerecord with auto-allocated ID."""
-    new_id = allocate_private_name_id_ttx(name_table)
-    siblings_before = [c for c in name_table if c.tag == "namerecord"]
+    """Create a new private namerecord with auto-allocated ID.
+
+    Pass `used` (from a prior scan of the table) when creating several records
+    in a row; it is updated in place so the table is not rescanned each time.
+    """
+    if used is None:
+        new_id = allocate_private_name_id_ttx(name_table)
+    else:
+        new_id = _allocate_private_name_id_from(used)
+    first_sibling = last_sibling = None
+    sibling_count = 0
+    for last_sibling in _iter_namerecords(name_table):
+        if first_sibling is None:
+            first_sibling = last_sibling
+        sibling_count += 1
 
     new_record = _create_namerecord_element(
         name_table, new_id, new_value, pid, eid, lang
     )
-    _insert_in_order(name_table, new_record)
-    _fix_namerecord_tails(name_table, new_record, siblings_before)
+    insert_idx = _insert_in_order(name_table, new_record)
+    _fix_namerecord_tails(
+        new_record, insert_idx, first_sibling, last_sibling, sibling_count
+    )
 
     return new_id
 
 
-def _remap_fvar_instances_ttx(fvar, old_id: int, new_id: int) -> int:
-    """Remap nameIDs in fvar instances."""
-    changes = 0
-    for inst in fvar.findall(".//NamedInstance"):
-        val = inst.get("subfamilyNameID")
-        try:
-            if val is not None and int(val) == int(old_id):
-                inst.set("subfamilyNameID", str(new_id))
-                changes += 1
-        except Exception:
-            pass
-        ps_val = inst.get("postscriptNameID")
-        try:
-            if ps_val is not None and int(ps_val) == int(old_id):
-                inst.set("postscriptNameID", str(new_id))
-                changes += 1
-        except Exception:
-            pass
-    return changes
+def _walk_stat(stat, on_elided, on_value_name, on_axis) -> None:
+    """Visit every nameID-bearing STAT element in a single descendant walk.
 
+    Dispatches ElidedFallbackNameID, AxisValue ValueNameID/LinkedValueNameID,
+    and DesignAxisRecord Axis elements to the matching callback.
+    """
+    for el in stat.iter():
+        tag = el.tag
+        if tag == "ValueNameID" or tag == "LinkedValueNameID":
+            on_value_name(el)
+        elif tag == "Axis":
+            on_axis(el)
+        elif tag == "ElidedFallbackNameID":
+            on_elided(el)
 
-def _remap_stat_elided_ttx(stat, old_id: int, new_id: int) -> int:
-    """Remap STAT ElidedFallbackNameID."""
-    elided = stat.find(XPATH_ELIDED_FALLBACK)
-    if elided is not None and elided.get("value") is not None:
-        try:
-            if int(elided.get("value")) == int(old_id):
-                elided.set("value", str(new_id))
-                return 1
-        except Exception:
-            pass
-    return 0
 
+def remap_fvar_stat_nameids_ttx(root, old_id: int, new_id: int) -> int:
+    """Update references to a name ID in fvar/STAT to a new private name ID."""
+    try:
+        return remap_fvar_stat_nameids_ttx_bulk(root, {int(old_id): new_id})
+    except Exception:
+        return 0
 
-def _remap_stat_axis_values_ttx(stat, old_id: int, new_id: int) -> int:
-    """Remap STAT AxisValue nameIDs."""
-    changes = 0
-    for axis_val in stat.findall(XPATH_AXIS_VALUE):
-        for tag in ("ValueNameID", "LinkedValueNameID"):
-            sub = axis_val.find(tag)
-            if sub is None:
-                continue
-            v = sub.get("value")
-            try:
-                if v is not None and int(v) == int(old_id):
-                    sub.set("value", str(new_id))
-                    changes += 1
-            except Exception:
-                continue
-    return changes
 
+def remap_fvar_stat_nameids_ttx_bulk(root, remap: dict[int, int]) -> int:
+    """Apply an {old_id: new_id} mapping to all fvar/STAT nameID references in one pass."""
+    if not remap:
+        return 0
 
-def _remap_stat_design_axis_ttx(stat, old_id: int, new_id: int) -> int:
-    """Remap STAT DesignAxisRecord axis labels."""
     changes = 0
-    for rec in stat.findall(XPATH_DESIGN_AXIS):
-        lab = rec.get("axisNameID") or rec.get("AxisNameID")
-        if lab is None:
-            continue
-        try:
-            if int(lab) == int(old_id):
-                rec.set("axisNameID", str(new_id))
-                changes += 1
-        except Exception:
-            continue
-    return changes
 
+    def _lookup(value):
+        nid = _parse_nameid(value)
+        return None if nid is None else remap.get(nid)
+
+    def _remap_value(el):
+        nonlocal changes
+        new_id = _lookup(el.get("value"))
+        if new_id is not None:
+            el.set("value", str(new_id))
+            changes += 1
+
+    def _remap_axis(el):
+        nonlocal changes
+        new_id = _lookup(el.get("axisNameID") or el.get("AxisNameID"))
+        if new_id is not None:
+            el.set("axisNameID", str(new_id))
+            changes += 1
 
-def remap_fvar_stat_nameids_ttx(root, old_id: int, new_id: int) -> int:
-    """Update references to a name ID in fvar/STAT to a new private name ID."""
-    changes = 0
     try:
-        fvar = root.find(XPATH_FVAR)
+        fvar = _find_table_ttx(root, "fvar")
         if fvar is not None:
-            changes += _remap_fvar_instances_ttx(fvar, old_id, new_id)
-
-        stat = root.find(XPATH_STAT)
+            for inst in fvar.findall(XPATH_NAMED_INSTANCE):
+                for attr in ("subfamilyNameID", "postscriptNameID"):
+                    new_id = _lookup(inst.get(attr))
+                    if new_id is not None:
+                        inst.set(attr, str(new_id))
+                        changes += 1
+
+        stat = _find_table_ttx(root, "STAT")
         if stat is not None:
-            changes += _remap_stat_elided_ttx(stat, old_id, new_id)
-            changes += _remap_stat_axis_values_ttx(stat, old_id, new_id)
-            changes += _remap_stat_design_axis_ttx(stat, old_id, new_id)
+            _walk_stat(stat, _remap_value, _remap_value, _remap_axis)
     except Exception:
         pass
     return changes
@@ -750,19 +950,11 @@ def remap_fvar_stat_nameids_ttx(root, old_id: int, new_id: int) -> int:
 def _collect_low_nameids_from_fvar_ttx(fvar, threshold: int) -> set[int]:
     """Collect nameIDs <= threshold from fvar."""
     to_remap: set[int] = set()
-    for inst in fvar.findall(".//NamedInstance"):
-        val = inst.get("subfamilyNameID")
-        try:
-            if val is not None and int(val) <= threshold:
-                to_remap.add(int(val))
-        except Exception:
-            pass
-        ps = inst.get("postscriptNameID")
-        try:
-            if ps is not None and int(ps) <= threshold:
-                to_remap.add(int(ps))
-        except Exception:
-            pass
+    for inst in fvar.findall(XPATH_NAMED_INSTANCE):
+        for attr in ("subfamilyNameID", "postscriptNameID"):
+            nid = _parse_nameid(inst.get(attr))
+            if nid is not None and nid <= threshold:
+                to_remap.add(nid)
     return to_remap
 
 
@@ -772,29 +964,16 @@ def _collect_low_nameids_from_stat_ttx(stat, threshold: int) -> set[int]:
 
     def _add_if_low(value):
         """Convert value to int and add to set if <= threshold."""
-        try:
-            v = int(value)
-            if v <= threshold:
-                low_ids.add(v)
-        except (TypeError, ValueError):
-            pass
-
-    # ElidedFallbackNameID
-    elided_el = stat.find(XPATH_ELIDED_FALLBACK)
-    if elided_el is not None:
-        _add_if_low(elided_el.get("value"))
-
-    # AxisValue ValueNameID / LinkedValueNameID
-    for axis_val_el in stat.findall(XPATH_AXIS_VALUE):
-        for tag in ("ValueNameID", "LinkedValueNameID"):
-            sub_el = axis_val_el.find(tag)
-            if sub_el is not None:
-                _add_if_low(sub_el.get("value"))
-
-    # DesignAxis axisNameID / AxisNameID
-    for axis_rec_el in stat.findall(XPATH_DESIGN_AXIS):
-        label_val = axis_rec_el.get("AxisNameID") or axis_rec_el.get("axisNameID")
-        _add_if_low(label_val)
+        v = _parse_nameid(value)
+        if v is not None and v <= threshold:
+            low_ids.add(v)
+
+    _walk_stat(
+        stat,
+        on_elided=lambda el: _add_if_low(el.get("value")),
+        on_value_name=lambda el: _add_if_low(el.get("value")),
+        on_axis=lambda el: _add_if_low(el.get("AxisNameID") or el.get("axisNameID")),
+    )
 
     return low_ids
 
@@ -803,31 +982,44 @@ def preserve_low_nameids_in_fvar_stat_ttx(root, name_table, threshold: int = 17)
     """Find fvar/STAT references to nameIDs <= threshold and remap them to new private IDs."""
     to_remap: set[int] = set()
     try:
-        fvar = root.find(XPATH_FVAR)
+        fvar = _find_table_ttx(root, "fvar")
         if fvar is not None:
             to_remap.update(_collect_low_nameids_from_fvar_ttx(fvar, threshold))
 
-        stat = root.find(XPATH_STAT)
+        stat = _find_table_ttx(root, "STAT")
         if stat is not None:
             to_remap.update(_collect_low_nameids_from_stat_ttx(stat, threshold))
     except Exception:
         pass
 
-    total_changes = 0
+    if not to_remap:
+        return 0
+
+    name_index = _build_nameid_index(name_table)
+    used = _collect_used_name_ids_ttx(name_table)
+    remap: dict[int, int] = {}
+    # Low IDs that resolve to the same string share one private record
+    str_to_new_id: dict[str, int] = {}
     for old_id in sorted(to_remap):
-        old_str = find_name_string_ttx(name_table, old_id)
+        old_str = None
+        nr = name_index.get(old_id)
+        if nr is not None:
+            old_str = normalize_empty(_extract_wrapped_text(nr.text)[1])
         if not old_str:
             old_str = find_name_string_any_platform_ttx(name_table, old_id)
         if not old_str:
             continue
-        new_id = create_private_namerecord_ttx(name_table, old_str)
-        total_changes += remap_fvar_stat_nameids_ttx(root, old_id, new_id)
-    return total_changes
+        new_id = str_to_new_id.get(old_str)
+        if new_id is None:
+            new_id = create_private_namerecord_ttx(name_table, old_str, used=used)
+            str_to_new_id[old_str] = new_id
+        remap[old_id] = new_id
+    return remap_fvar_stat_nameids_ttx_bulk(root, remap)
 
 
 def get_stat_elided_fallback_name_ttx(root, name_table) -> str | None:
     """Return the STAT ElidedFallbackNameID string (Windows/English) if present."""
-    stat = root.find(XPATH_STAT)
+    stat = _find_table_ttx(root, "STAT")
     if stat is None:
         return None
     elided = stat.find(XPATH_ELIDED_FALLBACK)
@@ -843,13 +1035,14 @@ def get_stat_elided_fallback_name_ttx(root, name_table) -> str | None:
 def get_stat_elided_fallback_name_binary(font) -> str | None:
     """Return the STAT ElidedFallbackNameID string (Windows/English) if present (binary)."""
     try:
-        if "STAT" not in font:
+        view = _font_view(font)
+        table = view.stat_table
+        if table is None:
             return None
-        table = font["STAT"].table
         nid = getattr(table, "ElidedFallbackNameID", None)
         if nid is None:
             return None
-        name_table = font.get("name")
+        name_table = view.name_table
         if name_table is None:
             return None
         rec = name_table.getName(nid, 3, 1, 0x409)
@@ -865,23 +1058,188 @@ def get_stat_elided_fallback_name_binary(font) -> str | None:
 
 # ---------------- Binary preservation (fvar/STAT) ----------------
 
+# Prebuilt getters for the STAT/fvar record fields read in per-record loops.
+_GET_AV_FORMAT = operator.attrgetter("Format")
+_GET_AV_VALUE = operator.attrgetter("Value")
+_GET_AV_RANGE = operator.attrgetter("RangeMinValue", "RangeMaxValue")
+_GET_AV_AXIS_INDEX = operator.attrgetter("AxisIndex")
+_GET_AV_NAMEID = operator.attrgetter("ValueNameID")
+_GET_AV_LINKED_NAMEID = operator.attrgetter("LinkedValueNameID")
+_GET_AXIS_TAG = operator.attrgetter("AxisTag")
+_GET_AXIS_NAMEID = operator.attrgetter("AxisNameID")
+_GET_FVAR_AXIS_DEFAULT = operator.attrgetter("axisTag", "defaultValue")
+_GET_INSTANCE_NAMEIDS = operator.attrgetter("subfamilyNameID", "postscriptNameID")
+
+
+@dataclass
+class _StatFvarScan:
+    """Everything the binary fvar/STAT pipelines read, gathered in one walk."""
+
+    tag_to_default: dict[str, float] = field(default_factory=dict)
+    index_to_tag: dict[int, str] = field(default_factory=dict)
+    instance_name_ids: list[int] = field(default_factory=list)
+    axis_name_ids: list[int] = field(default_factory=list)
+    value_name_ids: list[int] = field(default_factory=list)
+    elided_name_id: int | None = None
+    # axis index -> ValueNameIDs of AxisValues matching the fvar default, in order
+    default_label_ids: dict[int, list[int]] = field(default_factory=dict)
+
+    def low_name_ids(self, threshold: int) -> dict[int, None]:
+        """Referenced nameIDs <= threshold, deduplicated in fvar-then-STAT order."""
+        low: dict[int, None] = {}
+        for nid in self.instance_name_ids:
+            if nid <= threshold:
+                low[nid] = None
+        if self.elided_name_id is not None and self.elided_name_id <= threshold:
+            low[self.elided_name_id] = None
+        for ids in (self.axis_name_ids, self.value_name_ids):
+            for nid in ids:
+                if nid <= threshold:
+                    low[nid] = None
+        return low
+
+
+def _scan_stat_fvar_binary(fvar, stat) -> _StatFvarScan:
+    """Walk fvar axes/instances and STAT axes/AxisValues once each (binary).
+
+    Takes the already-resolved fvar table and STAT `.table` (either may be None).
+    """
+    scan = _StatFvarScan()
+
+    if fvar is not None:
+        for ax in getattr(fvar, "axes", None) or []:
+            try:
+                tag, default = _GET_FVAR_AXIS_DEFAULT(ax)
+            except AttributeError:
+                tag = getattr(ax, "axisTag", "")
+                default = getattr(ax, "defaultValue", 0.0)
+            if isinstance(default, (int, float)):
+                scan.tag_to_default[tag] = float(default)
+        append = scan.instance_name_ids.append
+        for inst in getattr(fvar, "instances", None) or []:
+            try:
+                sid, pid = _GET_INSTANCE_NAMEIDS(inst)
+            except AttributeError:
+                sid = getattr(inst, "subfamilyNameID", None)
+                pid = getattr(inst, "postscriptNameID", None)
+            if type(sid) is int:
+                append(sid)
+            if type(pid) is int:
+                append(pid)
+
+    if stat is None:
+        return scan
+
+    try:
+        elided = getattr(stat, "ElidedFallbackNameID", None)
+        if type(elided) is int:
+            scan.elided_name_id = elided
+
+        # Axis records
+        for i, axis in enumerate(
+            getattr(getattr(stat, "DesignAxisRecord", None), "Axis", []) or []
+        ):
+            try:
+                tag = _GET_AXIS_TAG(axis)
+            except AttributeError:
+                tag = None
+            if tag:
+                scan.index_to_tag[i] = tag
+            try:
+                axis_name_id = _GET_AXIS_NAMEID(axis)
+            except AttributeError:
+                continue
+            if type(axis_name_id) is int:
+                scan.axis_name_ids.append(axis_name_id)
+
+        # Resolve each axis's fvar default once instead of per AxisValue
+        index_to_default = {
+            i: scan.tag_to_default[tag]
+            for i, tag in scan.index_to_tag.items()
+            if tag in scan.tag_to_default
+        }
+
+        # AxisValue records; only format 3 has LinkedValueNameID.
+        # Hot per-record helpers are bound locally for the loop.
+        get_name_id, get_format = _GET_AV_NAMEID, _GET_AV_FORMAT
+        get_linked, get_axis_index = _GET_AV_LINKED_NAMEID, _GET_AV_AXIS_INDEX
+        check = _check_axis_value_match_binary
+        add_value_id = scan.value_name_ids.append
+        default_for = index_to_default.get
+        for av in getattr(getattr(stat, "AxisValueArray", None), "AxisValue", []) or []:
+            try:
+                value_name_id = get_name_id(av)
+            except AttributeError:
+                value_name_id = None
+            if type(value_name_id) is int:
+                add_value_id(value_name_id)
+            try:
+                fmt = get_format(av)
+            except AttributeError:
+                fmt = None
+            if fmt == 3:
+                try:
+                    linked = get_linked(av)
+                except AttributeError:
+                    linked = None
+                if type(linked) is int:
+                    add_value_id(linked)
+
+            if value_name_id is None or fmt not in (1, 2, 3):
+                continue
+            try:
+                axis_index = int(get_axis_index(av))
+            except AttributeError:
+                try:
+                    axis_index = int(getattr(av, "AxisIndices", [0])[0])
+                except (TypeError, ValueError, IndexError):
+                    continue
+            except (TypeError, ValueError):
+                continue
+            dv = default_for(axis_index)
+            if dv is not None and check(av, fmt, dv):
+                scan.default_label_ids.setdefault(axis_index, []).append(value_name_id)
+
+    except (AttributeError, TypeError, KeyError):
+        # ignore malformed STAT tables
+        pass
+
+    return scan
+
 
 def _collect_used_name_ids_binary(font: TTFont) -> set[int]:
     """Collect all used nameIDs from binary font."""
     used: set[int] = set()
     try:
-        if "name" not in font:
+        name_table = _font_view(font).name_table
+        if name_table is None:
             return used
-        for rec in font["name"].names:
-            try:
-                used.add(int(getattr(rec, "nameID", -1)))
-            except Exception:
-                continue
+        for rec in name_table.names:
+            nid = getattr(rec, "nameID", None)
+            if type(nid) is int:
+                used.add(nid)
     except Exception:
         return used
     return used
 
 
+def _build_nameid_index_binary(
+    font: TTFont,
+    pid: int = PID_WIN,
+    eid: int = EID_UNICODE_BMP,
+    lang: int = LANG_EN_US_INT,
+) -> dict[int, NameRecord]:
+    """Map nameID -> first NameRecord for the given platform/encoding/language (binary)."""
+    index: dict[int, NameRecord] = {}
+    name_table = _font_view(font).name_table
+    if name_table is None:
+        return index
+    for rec in name_table.names:
+        if rec.platformID == pid and rec.platEncID == eid and rec.langID == lang:
+            index.setdefault(rec.nameID, rec)
+    return index
+
+
 def allocate_private_name_id_binary(font: TTFont, start: int = 256) -> int:
     """Allocate a new private nameID not currently in use (binary)."""
     used = _collect_used_name_ids_binary(font)
@@ -907,61 +1265,83 @@ def create_private_namerecord_binary(
     nr.langID = int(lang)
     nr.string = new_value
     try:
-        font["name"].names.append(nr)
+        _font_view(font).name_table.names.append(nr)
     except Exception:
         pass
     return new_id
 
 
-def _remap_fvar_binary(font: TTFont, old_id: int, new_id: int) -> int:
-    """Remap nameIDs in fvar table (binary)."""
+def _remap_fvar_binary(font: TTFont, remap: dict[int, int]) -> int:
+    """Apply an {old_id: new_id} mapping to fvar instance nameIDs (binary)."""
     changes = 0
-    if "fvar" not in font:
+    try:
+        fvar = _font_view(font).fvar
+    except Exception:
+        # malformed fvar fails to decompile; leave STAT to its own helper
         return 0
+    if fvar is None:
+        return 0
+    get = remap.get
     try:
-        for inst in getattr(font["fvar"], "instances", []) or []:
-            if getattr(inst, "subfamilyNameID", None) == old_id:
+        # NamedInstance always carries both nameID fields once decompiled.
+        for inst in fvar.instances:
+            new_id = get(inst.subfamilyNameID)
+            if new_id is not None:
                 inst.subfamilyNameID = new_id
                 changes += 1
-            if getattr(inst, "postscriptNameID", None) == old_id:
+            new_id = get(inst.postscriptNameID)
+            if new_id is not None:
                 inst.postscriptNameID = new_id
                 changes += 1
-    except Exception:
+    except (AttributeError, TypeError):
         pass
     return changes
 
 
-def _remap_stat_binary(font: TTFont, old_id: int, new_id: int) -> int:
-    """Remap nameIDs in a binary STAT table.
+def _remap_stat_binary(font: TTFont, remap: dict[int, int]) -> int:
+    """Apply an {old_id: new_id} mapping to a binary STAT table.
 
     Returns the number of nameID fields updated.
     """
-    if "STAT" not in font:
+    try:
+        stat = _font_view(font).stat_table
+    except Exception:
+        # malformed STAT fails to decompile; fvar changes still stand
+        return 0
+    if stat is None:
         return 0
 
     changes = 0
+    get = remap.get
     try:
-        stat = font["STAT"].table
-
-        # ElidedFallbackNameID
-        if getattr(stat, "ElidedFallbackNameID", None) == old_id:
+        # ElidedFallbackNameID only exists on STAT 1.1+
+        new_id = get(getattr(stat, "ElidedFallbackNameID", None))
+        if new_id is not None:
             stat.ElidedFallbackNameID = new_id
             changes += 1
 
-        # Axis records
-        for axis in getattr(getattr(stat, "DesignAxisRecord", None), "Axis", []) or []:
-            if getattr(axis, "AxisNameID", None) == old_id:
-                axis.AxisNameID = new_id
-                changes += 1
+        # Axis records (container is None when the offset is 0)
+        design = stat.DesignAxisRecord
+        if design is not None:
+            for axis in design.Axis:
+                new_id = get(axis.AxisNameID)
+                if new_id is not None:
+                    axis.AxisNameID = new_id
+                    changes += 1
 
-        # AxisValue records
-        for av in getattr(getattr(stat, "AxisValueArray", None), "AxisValue", []) or []:
-            if getattr(av, "ValueNameID", None) == old_id:
-                av.ValueNameID = new_id
-                changes += 1
-            if getattr(av, "LinkedValueNameID", None) == old_id:
-                av.LinkedValueNameID = new_id
-                changes += 1
+        # AxisValue records. fontTools' format 3 carries LinkedValue, not a
+        # LinkedValueNameID, so that field is only remapped when present.
+        values = stat.AxisValueArray
+        if values is not None:
+            for av in values.AxisValue:
+                new_id = get(av.ValueNameID)
+                if new_id is not None:
+                    av.ValueNameID = new_id
+                    changes += 1
+                new_id = get(getattr(av, "LinkedValueNameID", None))
+                if new_id is not None:
+                    av.LinkedValueNameID = new_id
+                    changes += 1
 
     except (AttributeError, TypeError, KeyError):
         # ignore unexpected STAT structure
@@ -972,85 +1352,53 @@ def _remap_stat_binary(font: TTFont, old_id: int, new_id: int) -> int:
 
 def remap_fvar_stat_nameids_binary(font: TTFont, old_id: int, new_id: int) -> int:
     """Remap nameIDs in fvar/STAT (binary)."""
+    return remap_fvar_stat_nameids_binary_bulk(font, {int(old_id): new_id})
+
+
+def remap_fvar_stat_nameids_binary_bulk(font: TTFont, remap: dict[int, int]) -> int:
+    """Apply an {old_id: new_id} mapping to all fvar/STAT nameID references in one pass."""
+    if not remap:
+        return 0
     changes = 0
     try:
-        changes += _remap_fvar_binary(font, old_id, new_id)
-        changes += _remap_stat_binary(font, old_id, new_id)
+        view = _font_view(font)
+        changes += _remap_fvar_binary(view, remap)
+        changes += _remap_stat_binary(view, remap)
     except Exception:
         pass
+    if changes:
+        invalidate_style_name_cache(font)
     return changes
 
 
-def _collect_low_nameids_from_fvar_binary(font: TTFont, threshold: int) -> set[int]:
-    """Collect nameIDs <= threshold from fvar (binary)."""
-    to_remap: set[int] = set()
-    if "fvar" not in font:
-        return to_remap
+def preserve_low_nameids_in_fvar_stat_binary(font: TTFont, threshold: int = 17) -> int:
+    """Find fvar/STAT references to nameIDs <= threshold and remap them (binary)."""
+    view = _font_view(font)
+    # Tables decompile lazily; load each under its own guard so a malformed
+    # fvar still lets STAT references be preserved (and vice versa).
     try:
-        for inst in getattr(font["fvar"], "instances", []) or []:
-            sid = getattr(inst, "subfamilyNameID", None)
-            if isinstance(sid, int) and sid <= threshold:
-                to_remap.add(sid)
-            pid = getattr(inst, "postscriptNameID", None)
-            if isinstance(pid, int) and pid <= threshold:
-                to_remap.add(pid)
+        fvar = view.fvar
     except Exception:
-        pass
-    return to_remap
-
-
-def _collect_low_nameids_from_stat_binary(font: TTFont, threshold: int) -> set[int]:
-    """Collect all STAT nameIDs less than or equal to `threshold` from a binary STAT table."""
-    low_ids: set[int] = set()
-
-    if "STAT" not in font:
-        return low_ids
-
+        fvar = None
     try:
-        stat = font["STAT"].table
-
-        # ElidedFallbackNameID
-        elided = getattr(stat, "ElidedFallbackNameID", None)
-        if isinstance(elided, int) and elided <= threshold:
-            low_ids.add(elided)
-
-        # Axis records
-        for axis in getattr(getattr(stat, "DesignAxisRecord", None), "Axis", []) or []:
-            axis_name_id = getattr(axis, "AxisNameID", None)
-            if isinstance(axis_name_id, int) and axis_name_id <= threshold:
-                low_ids.add(axis_name_id)
-
-        # AxisValue records
-        for av in getattr(getattr(stat, "AxisValueArray", None), "AxisValue", []) or []:
-            for attr in ("ValueNameID", "LinkedValueNameID"):
-                name_id = getattr(av, attr, None)
-                if isinstance(name_id, int) and name_id <= threshold:
-                    low_ids.add(name_id)
-
-    except (AttributeError, TypeError, KeyError):
-        # ignore malformed STAT tables
-        pass
-
-    return low_ids
-
-
-def preserve_low_nameids_in_fvar_stat_binary(font: TTFont, threshold: int = 17) -> int:
-    """Find fvar/STAT references to nameIDs <= threshold and remap them (binary)."""
-    to_remap: set[int] = set()
+        stat = view.stat_table
+    except Exception:
+        stat = None
     try:
-        to_remap.update(_collect_low_nameids_from_fvar_binary(font, threshold))
-        to_remap.update(_collect_low_nameids_from_stat_binary(font, threshold))
+        to_remap = _scan_stat_fvar_binary(fvar, stat).low_name_ids(threshold)
     except Exception:
-        pass
+        return 0
+    if not to_remap:
+        return 0
 
-    total_changes = 0
-    for old_id in sorted(to_remap):
+    try:
+        name_index = _build_nameid_index_binary(view)
+    except Exception:
+        return 0
+    remap: dict[int, int] = {}
+    for old_id in to_remap:
         try:
-            rec = (
-                font["name"].getName(old_id, PID_WIN, EID_UNICODE_BMP, LANG_EN_US_INT)
-                if "name" in font
-                else None
-            )
+            rec = name_index.get(old_id)
             old_str = None
             if rec is not None:
                 try:
@@ -1059,22 +1407,53 @@ def preserve_low_nameids_in_fvar_stat_binary(font: TTFont, threshold: int = 17)
                     old_str = str(rec)
             if not old_str:
                 continue
-            new_id = create_private_namerecord_binary(font, old_str)
-            total_changes += remap_fvar_stat_nameids_binary(font, old_id, new_id)
+            remap[old_id] = create_private_namerecord_binary(view, old_str)
         except Exception:
             continue
-    return total_changes
+    return remap_fvar_stat_nameids_binary_bulk(view, remap)
 
 
 # ---------------- STAT default style name computation ----------------
 
+# Tolerance for comparing STAT values against fvar defaults.
+_IS_CLOSE_TOL = 1e-6
+
+
+def _emit_if_positive(default_val: float) -> bool:
+    return default_val > 0.0
+
+
+def _emit_if_nonzero(default_val: float) -> bool:
+    return abs(default_val) > _IS_CLOSE_TOL
+
+
+# Axis tags whose labels are only emitted when the default is non-neutral,
+# mapped to the predicate deciding that. Other tags always emit.
+_AXIS_EMIT_BINARY = {
+    "ital": _emit_if_positive,
+    "slnt": _emit_if_nonzero,
+    "obli": _emit_if_positive,
+}
+_AXIS_EMIT_TTX = {"ital": _emit_if_positive, "slnt": _emit_if_nonzero}
+
+
+def _get_name_from_id_binary(
+    font: TTFont, nid: int | None, name_index: dict[int, NameRecord] | None = None
+) -> str | None:
+    """Helper to read name string from nameID (binary).
 
-def _get_name_from_id_binary(font: TTFont, nid: int | None) -> str | None:
-    """Helper to read name string from nameID (binary)."""
+    Pass a prebuilt `name_index` (see _build_nameid_index_binary) to resolve
+    many IDs without rescanning the name table each time.
+    """
     if nid is None:
         return None
     try:
-        rec = font["name"].getName(int(nid), PID_WIN, EID_UNICODE_BMP, LANG_EN_US_INT)
+        if name_index is not None:
+            rec = name_index.get(int(nid))
+        else:
+            rec = _font_view(font).name_table.getName(
+                int(nid), PID_WIN, EID_UNICODE_BMP, LANG_EN_US_INT
+            )
         if rec is None:
             return None
         try:
@@ -1085,53 +1464,23 @@ def _get_name_from_id_binary(font: TTFont, nid: int | None) -> str | None:
         return None
 
 
-def _build_axis_default_map_binary(font: TTFont) -> dict[str, float]:
-    """Build map of axisTag -> defaultValue from fvar (binary)."""
-    tag_to_default: dict[str, float] = {}
-    try:
-        for ax in font["fvar"].axes:
-            tag_to_default[getattr(ax, "axisTag", "")] = float(
-                getattr(ax, "defaultValue", 0.0)
-            )
-    except Exception:
-        pass
-    return tag_to_default
-
-
-def _build_axis_index_map_binary(font: TTFont) -> dict[int, str]:
-    """Build map of axisIndex -> axisTag from STAT (binary)."""
-    index_to_tag: dict[int, str] = {}
+def _check_axis_value_match_binary(av, fmt: int, default_val: float) -> bool:
+    """Check if a binary AxisValue record of format `fmt` matches the default value."""
     try:
-        t = font["STAT"].table
-        if hasattr(t, "DesignAxisRecord") and hasattr(t.DesignAxisRecord, "Axis"):
-            for i, axis in enumerate(t.DesignAxisRecord.Axis):
-                tag = getattr(axis, "AxisTag", None)
-                if tag:
-                    index_to_tag[i] = tag
-    except Exception:
-        pass
-    return index_to_tag
-
-
-def _check_axis_value_match_binary(av, default_val: float) -> bool:
-    """Check if a binary AxisValue record matches the default value."""
-    try:
-        fmt = int(getattr(av, "Format", 0))
-    except (TypeError, ValueError):
-        return False
-
-    def _is_close(a, b, tol=1e-6):
-        return abs(a - b) < tol
-
-    try:
-        if fmt in (1, 3):
-            val = float(getattr(av, "Value", 0.0))
-            return _is_close(val, default_val)
+        if fmt == 1 or fmt == 3:
+            try:
+                val = float(_GET_AV_VALUE(av))
+            except AttributeError:
+                val = 0.0
+            return abs(val - default_val) < _IS_CLOSE_TOL
 
         if fmt == 2:
-            vmin = float(getattr(av, "RangeMinValue", default_val))
-            vmax = float(getattr(av, "RangeMaxValue", default_val))
-            return vmin <= default_val <= vmax
+            try:
+                vmin, vmax = _GET_AV_RANGE(av)
+            except AttributeError:
+                vmin = getattr(av, "RangeMinValue", default_val)
+                vmax = getattr(av, "RangeMaxValue", default_val)
+            return float(vmin) <= default_val <= float(vmax)
 
     except (TypeError, ValueError):
         return False
@@ -1139,100 +1488,86 @@ def _check_axis_value_match_binary(av, default_val: float) -> bool:
     return False
 
 
-def _collect_axis_labels_binary(
-    font: TTFont, tag_to_default: dict[str, float], index_to_tag: dict[int, str]
+def _resolve_axis_labels_binary(
+    font: TTFont, scan: _StatFvarScan, name_index: dict[int, NameRecord]
 ) -> dict[int, str]:
-    """Collect axis labels from STAT AxisValue entries that match defaults."""
+    """Pick the first non-empty label among each axis's default-matching AxisValues."""
     axis_label: dict[int, str] = {}
-
-    try:
-        t = font["STAT"].table
-        if not hasattr(t, "AxisValueArray") or not hasattr(
-            t.AxisValueArray, "AxisValue"
-        ):
-            return axis_label
-
-        for av in t.AxisValueArray.AxisValue:
-            axis_index = (
-                int(getattr(av, "AxisIndex", 0))
-                if hasattr(av, "AxisIndex")
-                else int(getattr(av, "AxisIndices", [0])[0])
-            )
-            tag = index_to_tag.get(axis_index)
-            if not tag:
-                continue
-            dv = tag_to_default.get(tag)
-            if dv is None:
-                continue
-
-            if _check_axis_value_match_binary(av, dv):
-                label = _get_name_from_id_binary(font, getattr(av, "ValueNameID", None))
-                if label and axis_index not in axis_label:
-                    axis_label[axis_index] = label
-    except Exception:
-        pass
-
+    for axis_index, name_ids in scan.default_label_ids.items():
+        for nid in name_ids:
+            label = _get_name_from_id_binary(font, nid, name_index)
+            if label:
+                axis_label[axis_index] = label
+                break
     return axis_label
 
 
 def _compose_style_tokens_binary(
-    font: TTFont, axis_labels: dict[int, str], tag_to_default: dict[str, float]
+    axis_labels: dict[int, str],
+    index_to_tag: dict[int, str],
+    tag_to_default: dict[str, float],
 ) -> list[str]:
     """Compose style tokens from a binary STAT table, preserving axis order."""
     tokens: list[str] = []
 
-    if "STAT" not in font:
-        return tokens
-
-    try:
-        stat = font["STAT"].table
-        axes = getattr(getattr(stat, "DesignAxisRecord", None), "Axis", []) or []
-    except (AttributeError, KeyError, TypeError):
-        return tokens
-
-    for i, axis in enumerate(axes):
-        tag = getattr(axis, "AxisTag", "") or ""
-        label = axis_labels.get(i)
+    for i in sorted(axis_labels):
+        label = axis_labels[i]
         if not label:
             continue
+        tag = index_to_tag.get(i, "")
+        emit = _AXIS_EMIT_BINARY.get(tag.lower())
+        if emit is None or emit(tag_to_default.get(tag, 0.0)):
+            tokens.append(label)
 
-        tag_lower = tag.lower()
-        default_val = tag_to_default.get(tag, 0.0)
-
-        if tag_lower == "ital":
-            if default_val > 0.0:
-                tokens.append(label)
-            continue
+    return tokens
 
-        if tag_lower == "slnt":
-            if abs(default_val) > 1e-6:
-                tokens.append(label)
-            continue
 
-        if tag_lower == "obli":
-            if default_val > 0.0:
-                tokens.append(label)
-            continue
+# Memoized compute_stat_default_style_name_binary results, keyed weakly by TTFont.
+_STYLE_NAME_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_MISS = object()
 
-        tokens.append(label)
 
-    return tokens
+def invalidate_style_name_cache(font: TTFont) -> None:
+    """Forget the cached default style name for `font` after editing its name/fvar/STAT."""
+    try:
+        _STYLE_NAME_CACHE.pop(_font_view(font).font, None)
+    except TypeError:
+        pass
 
 
 def compute_stat_default_style_name_binary(font: TTFont) -> str | None:
-    """Compute default style from STAT/fvar defaults (binary)."""
+    """Compute default style from STAT/fvar defaults (binary).
+
+    The result is cached per font; edits made through this module's binary
+    helpers invalidate it, other edits need invalidate_style_name_cache().
+    """
+    view = _font_view(font)
     try:
-        if "STAT" not in font or "fvar" not in font:
-            return None
+        cached = _STYLE_NAME_CACHE.get(view.font, _MISS)
+    except TypeError:
+        return _compute_stat_default_style_name_binary(view)
+    if cached is _MISS:
+        cached = _compute_stat_default_style_name_binary(view)
+        _STYLE_NAME_CACHE[view.font] = cached
+    return cached
 
-        tag_to_default = _build_axis_default_map_binary(font)
-        index_to_tag = _build_axis_index_map_binary(font)
 
-        if not index_to_tag or not tag_to_default:
+def _compute_stat_default_style_name_binary(view: _FontView) -> str | None:
+    try:
+        fvar, stat = view.fvar, view.stat_table
+        if stat is None or fvar is None:
+            return None
+
+        scan = _scan_stat_fvar_binary(fvar, stat)
+        if not scan.index_to_tag or not scan.tag_to_default:
             return None
 
-        axis_label = _collect_axis_labels_binary(font, tag_to_default, index_to_tag)
-        tokens = _compose_style_tokens_binary(font, axis_label, tag_to_default)
+        axis_label = _resolve_axis_labels_binary(
+            view, scan, _build_nameid_index_binary(view)
+        )
+        tokens = _compose_style_tokens_binary(
+            axis_label, scan.index_to_tag, scan.tag_to_default
+        )
 
         return " ".join(tokens) if tokens else None
     except Exception:
@@ -1242,13 +1577,10 @@ def compute_stat_default_style_name_binary(font: TTFont) -> str | None:
 # ---------------- TTX STAT default style name computation ----------------
 
 
-def _get_axis_index_to_tag_ttx(root) -> dict[int, str]:
-    """Build map of axis index -> tag from STAT (TTX)."""
+def _get_axis_index_to_tag_ttx(stat) -> dict[int, str]:
+    """Build map of axis index -> tag from a STAT element (TTX)."""
     mapping: dict[int, str] = {}
     try:
-        stat = root.find(XPATH_STAT)
-        if stat is None:
-            return mapping
         for axis in stat.findall(XPATH_DESIGN_AXIS):
             idx_raw = axis.get("index") or axis.get("Index")
             tag_el = axis.find("AxisTag")
@@ -1267,14 +1599,11 @@ def _get_axis_index_to_tag_ttx(root) -> dict[int, str]:
     return mapping
 
 
-def _get_fvar_default_by_tag_ttx(root) -> dict[str, float]:
-    """Build map of tag -> default value from fvar (TTX)."""
+def _get_fvar_default_by_tag_ttx(fvar) -> dict[str, float]:
+    """Build map of tag -> default value from an fvar element (TTX)."""
     defaults: dict[str, float] = {}
     try:
-        fvar = root.find(XPATH_FVAR)
-        if fvar is None:
-            return defaults
-        for axis in fvar.findall(".//Axis"):
+        for axis in fvar.iter("Axis"):
             tag_el = axis.find("AxisTag")
             tag = None
             if tag_el is not None:
@@ -1293,31 +1622,38 @@ def _get_fvar_default_by_tag_ttx(root) -> dict[str, float]:
     return defaults
 
 
-def _get_element_value_as_float(element, tag_name: str) -> float | None:
-    """Extract float value from child element."""
-    el = element.find(tag_name)
-    if el is None:
-        return None
-    try:
-        return float(el.get("value") if el.get("value") is not None else el.text)  # type: ignore[arg-type]
-    except Exception:
-        return None
-
-
-def _check_axis_value_match_ttx(axis_val, fmt: str, default_val: float) -> bool:
-    """Check whether a TTX AxisValue record matches the default axis value."""
+def _child_map(element) -> dict:
+    """Map child tag -> first child element, in a single pass over the children."""
+    children: dict = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
 
-    def _is_close(a, b, tol=1e-6):
-        return abs(a - b) < tol
 
-    if fmt in ("1", "3"):
-        v = _get_element_value_as_float(axis_val, "Value")
-        return v is not None and _is_close(v, default_val)
+def _check_axis_value_match_ttx(children: dict, fmt: str, default_val: float) -> bool:
+    """Check whether a TTX AxisValue record (as a _child_map) matches the default axis value."""
+    if fmt == "1" or fmt == "3":
+        el = children.get("Value")
+        if el is None:
+            return False
+        raw = el.get("value")
+        try:
+            v = float(raw if raw is not None else el.text)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+        return abs(v - default_val) < _IS_CLOSE_TOL
 
     if fmt == "2":
-        vmin = _get_element_value_as_float(axis_val, "RangeMinValue")
-        vmax = _get_element_value_as_float(axis_val, "RangeMaxValue")
-        if vmin is None or vmax is None:
+        lo_el = children.get("RangeMinValue")
+        hi_el = children.get("RangeMaxValue")
+        if lo_el is None or hi_el is None:
+            return False
+        lo_raw = lo_el.get("value")
+        hi_raw = hi_el.get("value")
+        try:
+            vmin = float(lo_raw if lo_raw is not None else lo_el.text)  # type: ignore[arg-type]
+            vmax = float(hi_raw if hi_raw is not None else hi_el.text)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
             return False
         return vmin <= default_val <= vmax
 
@@ -1325,19 +1661,26 @@ def _check_axis_value_match_ttx(axis_val, fmt: str, default_val: float) -> bool:
 
 
 def _collect_axis_labels_ttx(
-    root, name_table, idx_to_tag: dict[int, str], tag_to_default: dict[str, float]
+    stat_el,
+    name_strings: dict[int, str],
+    idx_to_tag: dict[int, str],
+    tag_to_default: dict[str, float],
 ) -> dict[int, str]:
-    """Collect STAT AxisValue labels from TTX that match each axis default value."""
-    axis_labels: dict[int, str] = {}
+    """Collect STAT AxisValue labels from TTX that match each axis default value.
 
-    stat_el = root.find(XPATH_STAT)
-    if stat_el is None:
-        return axis_labels
+    `name_strings` is the nameID -> string map from _build_name_strings_ttx.
+    """
+    axis_labels: dict[int, str] = {}
+    child_map, check = _child_map, _check_axis_value_match_ttx
 
-    for axis_val_el in stat_el.findall(XPATH_AXIS_VALUE):
+    for axis_val_el in stat_el.iter("AxisValue"):
         fmt = (axis_val_el.get("Format") or axis_val_el.get("format") or "0").strip()
+        # Only check formats 1–3
+        if fmt not in ("1", "2", "3"):
+            continue
 
-        axis_index_el = axis_val_el.find("AxisIndex")
+        children = child_map(axis_val_el)
+        axis_index_el = children.get("AxisIndex")
         if axis_index_el is None:
             continue
 
@@ -1346,16 +1689,15 @@ def _collect_axis_labels_ttx(
         except (TypeError, ValueError):
             continue
 
+        if axis_index in axis_labels:
+            continue
         axis_tag = idx_to_tag.get(axis_index)
         default_val = tag_to_default.get(axis_tag)
         if not axis_tag or default_val is None:
             continue
 
-        # Only check formats 1–3
-        if fmt in ("1", "2", "3") and _check_axis_value_match_ttx(
-            axis_val_el, fmt, default_val
-        ):
-            value_name_el = axis_val_el.find("ValueNameID")
+        if check(children, fmt, default_val):
+            value_name_el = children.get("ValueNameID")
             if value_name_el is None:
                 continue
 
@@ -1364,9 +1706,11 @@ def _collect_axis_labels_ttx(
             except (TypeError, ValueError):
                 continue
 
-            label = find_name_string_ttx(name_table, name_id)
-            if label and axis_index not in axis_labels:
+            label = name_strings.get(name_id)
+            if label:
                 axis_labels[axis_index] = label
+                if len(axis_labels) == len(idx_to_tag):
+                    break
 
     return axis_labels
 
@@ -1383,19 +1727,9 @@ def _compose_style_tokens_ttx(
         if idx not in axis_label:
             continue
         lbl = axis_label[idx]
-        tag_l = (tag or "").lower()
-
-        if tag_l == "ital":
-            default_val = tag_to_default.get(tag, 0.0)
-            if default_val > 0.0:
-                tokens.append(lbl)
-            continue
-        if tag_l == "slnt":
-            default_val = tag_to_default.get(tag, 0.0)
-            if abs(default_val) > 1e-6:
-                tokens.append(lbl)
-            continue
-        tokens.append(lbl)
+        emit = _AXIS_EMIT_TTX.get((tag or "").lower())
+        if emit is None or emit(tag_to_default.get(tag, 0.0)):
+            tokens.append(lbl)
 
     return tokens
 
@@ -1403,14 +1737,19 @@ def _compose_style_tokens_ttx(
 def compute_stat_default_style_name_ttx(root, name_table) -> str | None:
     """Compute default style name from STAT/fvar defaults (TTX)."""
     try:
-        idx_to_tag = _get_axis_index_to_tag_ttx(root)
-        tag_to_default = _get_fvar_default_by_tag_ttx(root)
+        stat = _find_table_ttx(root, "STAT")
+        fvar = _find_table_ttx(root, "fvar")
+        if stat is None or fvar is None:
+            return None
+
+        idx_to_tag = _get_axis_index_to_tag_ttx(stat)
+        tag_to_default = _get_fvar_default_by_tag_ttx(fvar)
 
         if not idx_to_tag or not tag_to_default:
             return None
 
         axis_label = _collect_axis_labels_ttx(
-            root, name_table, idx_to_tag, tag_to_default
+            stat, _build_name_strings_ttx(name_table), idx_to_tag, tag_to_default
         )
         tokens = _compose_style_tokens_ttx(idx_to_tag, axis_label, tag_to_default)
 
@@ -1422,17 +1761,16 @@ def compute_stat_default_style_name_ttx(root, name_table) -> str | None:
 # ---------------- CFF/CFF2 name sync (TTX XML) ----------------
 
 
+_CFF_TABLE_TAGS = ("CFF", "CFF2")
+
+
 def _iter_cff_roots(root):
-    """Yield elements that are CFF or CFF2 table roots in TTX XML."""
-    for el in root.iter():
-        try:
-            tag = (el.tag or "").strip()
-        except Exception:
-            continue
-        if not tag:
-            continue
-        if tag.upper().startswith("CFF"):
-            yield el
+    """Yield CFF/CFF2 table roots and their CFFFont elements in TTX XML."""
+    # Tables are direct children of <ttFont>; no need to walk glyph data.
+    for table in root:
+        if table.tag in _CFF_TABLE_TAGS:
+            yield table
+            yield from table.iter("CFFFont")
 
 
 def _sync_cff_fontname_ttx(cff_root, ps_name: str) -> bool:
@@ -1445,14 +1783,9 @@ def _sync_cff_fontname_ttx(cff_root, ps_name: str) -> bool:
         changed = True
 
     # Update all <CFFFont name="..."> attributes
-    for font_el in cff_root.findall(".//CFFFont"):
-        chg, _ = (False, None)
-        try:
-            chg, _ = update_attr_value(font_el, "name", ps_name)
-        except (AttributeError, TypeError, ValueError):
-            # ignore malformed or unexpected elements
-            continue
-        if chg:
+    for font_el in cff_root.iter("CFFFont"):
+        if font_el.get("name") != ps_name:
+            font_el.set("name", ps_name)
             changed = True
 
     return changed
@@ -1476,18 +1809,20 @@ def _sync_cff_familyname_ttx(cff_root, family_name: str) -> bool:
 
 def sync_cff_names_ttx(root) -> bool:
     """Sync CFF/CFF2 name fields from name table strings (TTX XML path)."""
-    name_table = root.find(XPATH_NAME)
+    cff_roots = list(_iter_cff_roots(root))
+    if not cff_roots:
+        return False
+    name_table = _find_table_ttx(root, "name")
     if name_table is None:
         return False
 
-    ps_name = find_name_string_ttx(name_table, 6)
-    full_name = find_name_string_ttx(name_table, 4)
-    family16 = find_name_string_ttx(name_table, 16)
-    family1 = find_name_string_ttx(name_table, 1)
-    family_name = family16 or family1
+    name_strings = _build_name_strings_ttx(name_table)
+    ps_name = name_strings.get(6)
+    full_name = name_strings.get(4)
+    family_name = name_strings.get(16) or name_strings.get(1)
 
     changed_any = False
-    for cff_root in _iter_cff_roots(root):
+    for cff_root in cff_roots:
         if ps_name:
             changed_any |= _sync_cff_fontname_ttx(cff_root, ps_name)
         if full_name:
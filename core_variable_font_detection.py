@@ -37,13 +37,24 @@ Usage:
 """
 
 from __future__ import annotations
+import operator
+import sys
+import weakref
 from enum import Enum
-from dataclasses import dataclass
-from typing import Any, List
+from dataclasses import dataclass, field, replace
+from typing import Any, List, NamedTuple
 from FontCore.core_logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_FVAR_AXIS_TAG = operator.attrgetter("axisTag")
+_STAT_AXIS_TAG = operator.attrgetter("AxisTag")
+
+
+def _intern_tag(tag: Any) -> Any:
+    """Intern axis-tag strings so batch scans share one object per tag."""
+    return sys.intern(tag) if type(tag) is str else tag
+
 
 class VariableFontMode(Enum):
     """
@@ -59,7 +70,7 @@ class VariableFontMode(Enum):
     PEDANTIC = "pedantic"
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableFontAnalysis:
     """
     Detailed analysis of variable font properties.
@@ -74,16 +85,9 @@ class VariableFontAnalysis:
     has_avar: bool = False
     has_mvar: bool = False
     axis_count: int = 0
-    axes: List[str] = None  # List of axis tags
+    axes: List[str] = field(default_factory=list)  # List of axis tags
     instance_count: int = 0
-    issues: List[str] = None  # List of detected issues
-
-    def __post_init__(self):
-        """Set defaults and extract stack trace."""
-        if self.axes is None:
-            self.axes = []
-        if self.issues is None:
-            self.issues = []
+    issues: List[str] = field(default_factory=list)  # List of detected issues
 
     @property
     def is_spec_compliant(self) -> bool:
@@ -112,48 +116,97 @@ class VariableFontAnalysis:
         }
 
 
-def _check_table_presence(font: Any, table_tag: str) -> bool:
-    """Safely check if font has a table."""
+# mode -> rule(has_fvar, has_stat), shared by the binary and TTX analyzers
+_IS_VARIABLE_RULE = {
+    VariableFontMode.STRICT: lambda has_fvar, has_stat: has_fvar and has_stat,
+    VariableFontMode.LENIENT: lambda has_fvar, has_stat: has_fvar,
+    VariableFontMode.PEDANTIC: lambda has_fvar, has_stat: has_fvar and has_stat,
+}
+
+
+def _never_variable(has_fvar: bool, has_stat: bool) -> bool:
+    """Rule for unknown modes."""
+    return False
+
+
+_TABLE_PRESENCE_TAGS = ("fvar", "STAT", "avar", "MVAR")
+
+
+def _table_presence(font: Any) -> tuple[bool, bool, bool, bool]:
+    """
+    Safely check which variation tables the font has.
+
+    Returns:
+        Tuple of (has_fvar, has_stat, has_avar, has_mvar)
+    """
     try:
-        return table_tag in font
+        return (
+            "fvar" in font,
+            "STAT" in font,
+            "avar" in font,
+            "MVAR" in font,
+        )
     except Exception as e:
-        logger.debug(f"Error checking for table '{table_tag}': {e}")
-        return False
+        logger.debug("Error checking for variation tables: %s", e)
+        return (False, False, False, False)
+
+
+class _AxisInfo(NamedTuple):
+    """Axis summary returned by the fvar extractors."""
 
+    axis_count: int
+    axis_tags: List[str]
+    instance_count: int
 
-def _extract_axis_info(font: Any) -> tuple[int, List[str], int]:
+
+def _extract_axis_info(fvar: Any) -> _AxisInfo:
     """
     Extract axis information from fvar table.
 
+    Args:
+        fvar: Already-resolved fvar table, or None when the font has none
+
     Returns:
-        Tuple of (axis_count, axis_tags, instance_count)
+        _AxisInfo(axis_count, axis_tags, instance_count)
     """
     axis_count = 0
     axis_tags = []
     instance_count = 0
 
-    try:
-        if "fvar" in font:
-            fvar = font["fvar"]
+    if fvar is None:
+        return _AxisInfo(axis_count, axis_tags, instance_count)
 
-            # Get axes
-            if hasattr(fvar, "axes"):
-                axis_count = len(fvar.axes)
+    try:
+        # Get axes
+        if hasattr(fvar, "axes"):
+            axis_count = len(fvar.axes)
+            try:
+                axis_tags = list(map(_FVAR_AXIS_TAG, fvar.axes))
+            except AttributeError:
                 axis_tags = [getattr(axis, "axisTag", "") for axis in fvar.axes]
+            axis_tags = list(map(_intern_tag, axis_tags))
 
-            # Get instances
-            if hasattr(fvar, "instances"):
-                instance_count = len(fvar.instances)
+        # Get instances
+        if hasattr(fvar, "instances"):
+            instance_count = len(fvar.instances)
 
     except Exception as e:
-        logger.debug(f"Error extracting axis info: {e}")
+        logger.debug("Error extracting axis info: %s", e)
 
-    return axis_count, axis_tags, instance_count
+    return _AxisInfo(axis_count, axis_tags, instance_count)
 
 
-def _validate_stat_structure(font: Any) -> List[str]:
+def _validate_pedantic(font: Any, fvar: Any) -> List[str]:
     """
-    Validate STAT table structure (for pedantic mode).
+    Validate STAT structure and fvar default coverage (for pedantic mode).
+
+    Resolves the STAT table once and shares its DesignAxisRecord/AxisValue
+    lists between the structural checks and the fvar default check. The
+    caller has already established that the font has a STAT table.
+
+    Args:
+        font: Font object (TTFont instance)
+        fvar: fvar table already resolved by the analyzer, or None
 
     Returns:
         List of issues found (empty if valid)
@@ -161,27 +214,33 @@ def _validate_stat_structure(font: Any) -> List[str]:
     issues = []
 
     try:
-        if "STAT" not in font:
-            issues.append("Missing STAT table")
-            return issues
-
         stat = font["STAT"].table
+    except Exception as e:
+        issues.append(f"Error validating STAT: {e}")
+        return issues
 
+    design_axes = None
+    axis_values = None
+    try:
         # Check for DesignAxisRecord
         if not hasattr(stat, "DesignAxisRecord"):
             issues.append("STAT missing DesignAxisRecord")
         elif not hasattr(stat.DesignAxisRecord, "Axis"):
             issues.append("STAT DesignAxisRecord has no Axis records")
-        elif not stat.DesignAxisRecord.Axis:
-            issues.append("STAT DesignAxisRecord.Axis is empty")
+        else:
+            design_axes = stat.DesignAxisRecord.Axis
+            if not design_axes:
+                issues.append("STAT DesignAxisRecord.Axis is empty")
 
         # Check for AxisValueArray
         if not hasattr(stat, "AxisValueArray"):
             issues.append("STAT missing AxisValueArray")
         elif not hasattr(stat.AxisValueArray, "AxisValue"):
             issues.append("STAT AxisValueArray has no AxisValue records")
-        elif not stat.AxisValueArray.AxisValue:
-            issues.append("STAT AxisValueArray.AxisValue is empty")
+        else:
+            axis_values = stat.AxisValueArray.AxisValue
+            if not axis_values:
+                issues.append("STAT AxisValueArray.AxisValue is empty")
 
         # Check for ElidedFallbackNameID
         if not hasattr(stat, "ElidedFallbackNameID"):
@@ -190,46 +249,37 @@ def _validate_stat_structure(font: Any) -> List[str]:
     except Exception as e:
         issues.append(f"Error validating STAT: {e}")
 
-    return issues
-
-
-def _validate_axis_defaults(font: Any) -> List[str]:
-    """
-    Validate that fvar axis defaults match STAT values (for pedantic mode).
-
-    Returns:
-        List of issues found (empty if valid)
-    """
-    issues = []
-
     try:
-        if "fvar" not in font or "STAT" not in font:
+        if fvar is None:
             return issues
 
         # Get axis defaults from fvar
         fvar_defaults = {}
-        for axis in font["fvar"].axes:
+        for axis in fvar.axes:
             tag = getattr(axis, "axisTag", None)
             default = getattr(axis, "defaultValue", None)
             if tag and default is not None:
                 fvar_defaults[tag] = float(default)
 
         # Check if STAT has corresponding AxisValue records for defaults
-        stat = font["STAT"].table
         if not hasattr(stat, "AxisValueArray") or not stat.AxisValueArray:
             issues.append("STAT has no AxisValue records to match fvar defaults")
             return issues
+        if axis_values is None:
+            axis_values = stat.AxisValueArray.AxisValue
 
         # This is a simplified check - full validation would be more complex
-        axis_tags_with_values = set()
-        for av in stat.AxisValueArray.AxisValue:
+        # Fonts have a handful of axes; a short list beats a set here
+        axis_tags_with_values = []
+        for av in axis_values:
             axis_index = getattr(av, "AxisIndex", None)
-            if axis_index is not None and hasattr(stat, "DesignAxisRecord"):
+            if axis_index is not None and design_axes is not None:
                 try:
-                    axis = stat.DesignAxisRecord.Axis[axis_index]
-                    axis_tags_with_values.add(getattr(axis, "AxisTag", ""))
+                    tag = _STAT_AXIS_TAG(design_axes[axis_index])
                 except (IndexError, AttributeError):
-                    pass
+                    continue
+                if tag not in axis_tags_with_values:
+                    axis_tags_with_values.append(tag)
 
         # Check for axes without STAT values
         for tag in fvar_defaults:
@@ -242,12 +292,58 @@ def _validate_axis_defaults(font: Any) -> List[str]:
     return issues
 
 
+# Per-font memo of analyses: {font: {mode: VariableFontAnalysis}}. Weak keys
+# let entries disappear with the font; fonts that cannot be weak-referenced
+# are simply analyzed on every call. Callers always get a copy (see below).
+_ANALYSIS_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _copy_analysis(analysis: VariableFontAnalysis) -> VariableFontAnalysis:
+    """Copy an analysis so callers cannot mutate the memoized axes/issues."""
+    return replace(analysis, axes=list(analysis.axes), issues=list(analysis.issues))
+
+
+def _cached_analysis(obj: Any, mode: VariableFontMode, analyze) -> VariableFontAnalysis:
+    """Return a copy of the memoized analysis of obj for mode."""
+    try:
+        per_mode = _ANALYSIS_CACHE.get(obj)
+    except TypeError:
+        return analyze(obj, mode)
+    if per_mode is None:
+        per_mode = _ANALYSIS_CACHE[obj] = {}
+    analysis = per_mode.get(mode)
+    if analysis is None:
+        analysis = per_mode[mode] = analyze(obj, mode)
+    return _copy_analysis(analysis)
+
+
+def clear_variable_font_cache(font: Any = None) -> None:
+    """
+    Drop memoized analyses.
+
+    Args:
+        font: Font to forget; clears every entry when None.
+            Call this after adding/removing fvar, STAT, avar or MVAR.
+    """
+    if font is None:
+        _ANALYSIS_CACHE.clear()
+        return
+    try:
+        _ANALYSIS_CACHE.pop(font, None)
+    except TypeError:
+        pass
+
+
 def analyze_variable_font(
     font: Any, mode: VariableFontMode = VariableFontMode.STRICT
 ) -> VariableFontAnalysis:
     """
     Perform detailed analysis of variable font properties.
 
+    Results are memoized per font and mode; each call returns a fresh copy,
+    so mutating it does not affect later results. Call
+    clear_variable_font_cache() after editing the font's variation tables.
+
     Args:
         font: Font object (TTFont instance)
         mode: Detection mode (determines is_variable result)
@@ -263,24 +359,27 @@ def analyze_variable_font(
         ...     for issue in analysis.issues:
         ...         print(f"WARNING: {issue}")
     """
+    return _cached_analysis(font, mode, _analyze_variable_font)
+
+
+def _analyze_variable_font(font: Any, mode: VariableFontMode) -> VariableFontAnalysis:
+    """Uncached body of analyze_variable_font."""
     # Check table presence
-    has_fvar = _check_table_presence(font, "fvar")
-    has_stat = _check_table_presence(font, "STAT")
-    has_avar = _check_table_presence(font, "avar")
-    has_mvar = _check_table_presence(font, "MVAR")
+    has_fvar, has_stat, has_avar, has_mvar = _table_presence(font)
+
+    # Resolve fvar once for axis extraction and pedantic validation
+    fvar = None
+    if has_fvar:
+        try:
+            fvar = font["fvar"]
+        except Exception as e:
+            logger.debug("Error loading fvar table: %s", e)
 
     # Extract axis information
-    axis_count, axes, instance_count = _extract_axis_info(font)
+    axis_count, axes, instance_count = _extract_axis_info(fvar)
 
     # Determine if font is variable based on mode
-    if mode == VariableFontMode.STRICT:
-        is_variable = has_fvar and has_stat
-    elif mode == VariableFontMode.LENIENT:
-        is_variable = has_fvar
-    elif mode == VariableFontMode.PEDANTIC:
-        is_variable = has_fvar and has_stat
-    else:
-        is_variable = False
+    is_variable = _IS_VARIABLE_RULE.get(mode, _never_variable)(has_fvar, has_stat)
 
     # Collect issues
     issues = []
@@ -292,13 +391,9 @@ def analyze_variable_font(
     if has_fvar and axis_count == 0:
         issues.append("fvar table exists but has no axes")
 
-    # Pedantic mode: additional validation
+    # Pedantic mode: additional validation (is_variable implies fvar + STAT)
     if mode == VariableFontMode.PEDANTIC and is_variable:
-        stat_issues = _validate_stat_structure(font)
-        issues.extend(stat_issues)
-
-        axis_issues = _validate_axis_defaults(font)
-        issues.extend(axis_issues)
+        issues.extend(_validate_pedantic(font, fvar))
 
     return VariableFontAnalysis(
         is_variable=is_variable,
@@ -340,17 +435,105 @@ def is_variable_font(
         >>> is_variable_font(font, mode=VariableFontMode.PEDANTIC)
         False  # if STAT structure has issues
     """
+    # Strict/lenient only need table presence; skip building the analysis
+    if mode == VariableFontMode.LENIENT:
+        return _table_presence(font)[0]
+    if mode == VariableFontMode.STRICT:
+        has_fvar, has_stat = _table_presence(font)[:2]
+        return has_fvar and has_stat
+
     analysis = analyze_variable_font(font, mode)
 
     # Log issues in pedantic mode
     if mode == VariableFontMode.PEDANTIC and analysis.issues:
         for issue in analysis.issues:
-            logger.warning(f"Variable font validation: {issue}")
+            logger.warning("Variable font validation: %s", issue)
 
     return analysis.is_variable
 
 
 # TTX-specific functions
+def _children_by_tag(element: Any) -> dict:
+    """Map tag -> first direct child with that tag, in one pass."""
+    children: dict = {}
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+
+def _ttx_tables(root: Any) -> dict:
+    """
+    Map table tag -> table element for a TTX document.
+
+    Tables are direct children of <ttFont>, so that case never walks the
+    glyph data. Other roots (wrapped or partial documents) fall back to a
+    descendant search for the variation tables missing at the top level.
+    """
+    tables = _children_by_tag(root)
+    if getattr(root, "tag", None) != "ttFont":
+        for tag in _TABLE_PRESENCE_TAGS:
+            if tag not in tables:
+                table_el = root.find(f".//{tag}")
+                if table_el is not None:
+                    tables[tag] = table_el
+    return tables
+
+
+def _axis_tag_ttx(axis_el: Any) -> Any:
+    """Return the interned AxisTag of an fvar <Axis> element, or None."""
+    tag_el = axis_el.find("AxisTag")
+    if tag_el is None:
+        return None
+    # ttx writes <AxisTag value="wght"/>; text is a fallback
+    tag = tag_el.get("value")
+    if tag is None:
+        tag = (tag_el.text or "").strip()
+    return _intern_tag(tag) if tag else None
+
+
+def _extract_axis_info_ttx(fvar: Any) -> _AxisInfo:
+    """
+    Extract axis information from a TTX <fvar> element.
+
+    Axis and NamedInstance are direct children of <fvar> in ttx output, so
+    both are counted in a single pass over those children; a descendant
+    search is only used for whichever kind that pass did not find.
+
+    Args:
+        fvar: fvar element, or None when the document has none
+
+    Returns:
+        _AxisInfo(axis_count, axis_tags, instance_count)
+    """
+    axis_count = 0
+    axes = []
+    instance_count = 0
+
+    if fvar is None:
+        return _AxisInfo(axis_count, axes, instance_count)
+
+    for child in fvar:
+        child_tag = child.tag
+        if child_tag == "Axis":
+            axis_count += 1
+            tag = _axis_tag_ttx(child)
+            if tag:
+                axes.append(tag)
+        elif child_tag == "NamedInstance":
+            instance_count += 1
+
+    if not axis_count:
+        for axis_el in fvar.iterfind(".//Axis"):
+            axis_count += 1
+            tag = _axis_tag_ttx(axis_el)
+            if tag:
+                axes.append(tag)
+    if not instance_count:
+        instance_count = len(fvar.findall(".//NamedInstance"))
+
+    return _AxisInfo(axis_count, axes, instance_count)
+
+
 def analyze_variable_font_ttx(
     root: Any, mode: VariableFontMode = VariableFontMode.STRICT
 ) -> VariableFontAnalysis:
@@ -370,41 +553,22 @@ def analyze_variable_font_ttx(
         >>> print(f"Variable: {analysis.is_variable}")
     """
     try:
+        # TTX tables are direct children of <ttFont>; bucket them once
+        tables = _ttx_tables(root)
+        fvar = tables.get("fvar")
+        stat = tables.get("STAT")
+
         # Check table presence
-        has_fvar = root.find(".//fvar") is not None
-        has_stat = root.find(".//STAT") is not None
-        has_avar = root.find(".//avar") is not None
-        has_mvar = root.find(".//MVAR") is not None
+        has_fvar = fvar is not None
+        has_stat = stat is not None
+        has_avar = "avar" in tables
+        has_mvar = "MVAR" in tables
 
         # Extract axis information
-        axis_count = 0
-        axes = []
-        instance_count = 0
-
-        if has_fvar:
-            fvar = root.find(".//fvar")
-            axis_elements = fvar.findall(".//Axis")
-            axis_count = len(axis_elements)
-
-            for axis_el in axis_elements:
-                tag_el = axis_el.find("AxisTag")
-                if tag_el is not None:
-                    tag = tag_el.get("value") or (tag_el.text or "").strip()
-                    if tag:
-                        axes.append(tag)
-
-            instance_elements = fvar.findall(".//NamedInstance")
-            instance_count = len(instance_elements)
+        axis_count, axes, instance_count = _extract_axis_info_ttx(fvar)
 
         # Determine if variable based on mode
-        if mode == VariableFontMode.STRICT:
-            is_variable = has_fvar and has_stat
-        elif mode == VariableFontMode.LENIENT:
-            is_variable = has_fvar
-        elif mode == VariableFontMode.PEDANTIC:
-            is_variable = has_fvar and has_stat
-        else:
-            is_variable = False
+        is_variable = _IS_VARIABLE_RULE.get(mode, _never_variable)(has_fvar, has_stat)
 
         # Collect issues
         issues = []
@@ -417,13 +581,13 @@ def analyze_variable_font_ttx(
 
         # Pedantic validation for TTX
         if mode == VariableFontMode.PEDANTIC and is_variable:
-            stat = root.find(".//STAT")
             if stat is not None:
-                if stat.find(".//DesignAxisRecord") is None:
+                stat_children = _children_by_tag(stat)
+                if "DesignAxisRecord" not in stat_children:
                     issues.append("STAT missing DesignAxisRecord")
-                if stat.find(".//AxisValueArray") is None:
+                if "AxisValueArray" not in stat_children:
                     issues.append("STAT missing AxisValueArray")
-                if stat.find(".//ElidedFallbackNameID") is None:
+                if "ElidedFallbackNameID" not in stat_children:
                     issues.append("STAT missing ElidedFallbackNameID (recommended)")
 
         return VariableFontAnalysis(
@@ -472,7 +636,7 @@ def is_variable_font_ttx(
     # Log issues in pedantic mode
     if mode == VariableFontMode.PEDANTIC and analysis.issues:
         for issue in analysis.issues:
-            logger.warning(f"Variable font validation: {issue}")
+            logger.warning("Variable font validation: %s", issue)
 
     return analysis.is_variable
 
@@ -498,8 +662,11 @@ def is_variable_font_binary(font: Any, strict: bool = True) -> bool:
         >>> is_variable_font_binary(font, strict=False)
         True
     """
-    mode = VariableFontMode.STRICT if strict else VariableFontMode.LENIENT
-    return is_variable_font(font, mode)
+    # Two table lookups answer this; skip mode resolution and the analyzer
+    try:
+        return ("fvar" in font) and (not strict or "STAT" in font)
+    except Exception:
+        return False
 
 
 __all__ = [
@@ -509,5 +676,6 @@ __all__ = [
     "analyze_variable_font",
     "is_variable_font_ttx",
     "analyze_variable_font_ttx",
+    "clear_variable_font_cache",
     "is_variable_font_binary",  # Backward compatibility
 ]